@@ -1,32 +1,512 @@
 import sys
+import os
+import stat
+import socket
+
+# --- COMMAND LINE ---
+# `Lumex8.py <command> [args]` hands the command to the launcher that is already running and
+# exits. This runs before the Qt imports, so a second invocation (a window manager keybinding,
+# a script) costs little more than interpreter startup. The protocol is one text line per
+# connection on a Unix socket, answered with "ok" or "error: ...", so
+# `echo toggle | socat - UNIX-CONNECT:$XDG_RUNTIME_DIR/lumex8-$UID.sock` works as well (without a
+# runtime directory the socket lives in the private /tmp/lumex8-$UID/ directory). Only
+# sys, os, stat and socket are imported this early; `python -m Lumex8 toggle` also skips compiling
+# this file, which Python does not cache for scripts.
+COMMANDS = ('toggle', 'show', 'hide', 'launch', 'reload', 'quit')
+
+def instance_socket_path(create=False):
+    # $XDG_RUNTIME_DIR is private to the user. Without it the socket goes in /tmp/lumex8-<uid>,
+    # a directory that must be ours with mode 0700, so another local user cannot claim the name
+    # first and answer our commands. None when that directory is missing (and not create) or unsafe.
+    if not hasattr(os, 'getuid'): return os.path.join(os.environ.get('TEMP', "."), "lumex8.sock")
+    name = f"lumex8-{os.getuid()}.sock"
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime: return os.path.join(runtime, name)
+    private = os.path.join("/tmp", f"lumex8-{os.getuid()}")
+    if create:
+        try: os.mkdir(private, 0o700)
+        except FileExistsError: pass
+        except OSError: return None
+    try: st = os.lstat(private)
+    except OSError: return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077: return None
+    return os.path.join(private, name)
+
+def connect_instance(timeout=2.0):
+    path = instance_socket_path()
+    if path is None: raise FileNotFoundError("no private directory for the instance socket")
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    s.settimeout(timeout)
+    try: s.connect(path)
+    except OSError:
+        s.close()
+        raise
+    return s
+
+def send_command(words, timeout=None):
+    # Reply of the running instance, or None when no instance is running
+    if not hasattr(socket, 'AF_UNIX'): return None
+    if timeout is None: timeout = 10.0 if words[0] == 'launch' else 2.0 # launch answers after the spawn
+    try: s = connect_instance(timeout)
+    except OSError: return None
+    with s:
+        try:
+            s.sendall((" ".join(words) + "\n").encode())
+            reply = b""
+            while chunk := s.recv(4096): reply += chunk
+        except OSError as e: return f"error: {e}"
+    return reply.decode(errors='replace').strip() or "error: no reply"
+
+def command_from_argv(argv):
+    # Plain `Lumex8.py` means "show"; arguments starting with '-' are left to Qt
+    if len(argv) > 1 and argv[1] in COMMANDS: return argv[1:]
+    if len(argv) > 1 and not argv[1].startswith('-'):
+        sys.exit(f"unknown command {argv[1]!r}; expected one of: {', '.join(COMMANDS)}")
+    return ['show']
+
+if __name__ == "__main__":
+    _words = command_from_argv(sys.argv)
+    _reply = send_command(_words)
+    if _reply is None and _words[0] == 'quit': sys.exit(0) # nothing to quit
+    if _reply is not None:
+        if _reply != "ok": print(_reply, file=sys.stderr)
+        sys.exit(0 if _reply == "ok" else 1)
+
 import json
 import subprocess
-import os
 import shutil
+import shlex
+import threading
+import bisect
+import time
+import logging
+import hashlib
+import operator
+import sqlite3
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QGridLayout, 
                              QPushButton, QLabel, QVBoxLayout, QHBoxLayout, 
                              QMessageBox, QDialog, QLineEdit, QFileDialog, 
                              QColorDialog, QMenu, QFormLayout, QComboBox, 
                              QSystemTrayIcon, QScrollArea, QInputDialog, QStackedWidget,
-                             QListWidget, QListWidgetItem, QTabWidget, QStyleOptionButton,
-                             QCheckBox, QSlider, QFrame, QGroupBox, QSizePolicy, QSpinBox)
-from PyQt6.QtCore import (Qt, QMimeData, QPoint, QSize, QPropertyAnimation, 
-                          QRect, QEasingCurve, pyqtProperty, QEvent, QTimer)
-from PyQt6.QtGui import QAction, QPixmap, QFont, QColor, QDrag, QIcon, QPainter, QKeyEvent, QFontMetrics
-from pynput import keyboard
+                             QListWidget, QListView, QTabWidget, QStyleOptionButton,
+                             QCheckBox, QSlider, QFrame, QGroupBox, QSizePolicy, QSpinBox, QPlainTextEdit)
+from PyQt6.QtCore import (Qt, QMimeData, QPoint, QSize, 
+                          QRect, QRectF, QEvent, QTimer,
+                          QObject, QRunnable, QThreadPool, QThread, pyqtSignal, QFileSystemWatcher, QSocketNotifier,
+                          QAbstractListModel, QModelIndex, QSortFilterProxyModel, QUrl)
+from PyQt6.QtGui import (QAction, QPixmap, QFont, QColor, QDrag, QIcon, QPainter, QPen, QKeyEvent, QFontMetrics,
+                         QImageReader, QDesktopServices)
+from PyQt6.QtNetwork import QLocalServer
+from tile_layout import TILE_SPANS, fit_span, pack_tiles
+
+log = logging.getLogger("lumex8")
 
 # --- GLOBAL CACHE --
-ICON_CACHE = {}
-
-def get_cached_pixmap(path, w, h):
-    key = (path, w, h)
-    if key in ICON_CACHE: return ICON_CACHE[key]
-    if os.path.exists(path):
-        pix = QPixmap(path).scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        ICON_CACHE[key] = pix
-        return pix
-    return None
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser("~/.cache"), "lumex8")
+
+class PixmapCache:
+    # LRU of render-ready pixmaps keyed by (path, mode, w, h, dpr), bounded by an approximate byte budget
+    # (w * h * depth). Each entry remembers its source mtime and is dropped when the file changes.
+    def __init__(self, budget_bytes):
+        self.budget = budget_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def cost(pix):
+        return pix.width() * pix.height() * max(pix.depth(), 8) // 8
+
+    def get(self, key, mtime):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[1] != mtime:
+            self.invalidations += 1
+            self.misses += 1
+            self.remove(key)
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, pix, mtime):
+        self.remove(key)
+        size = self.cost(pix)
+        self.entries[key] = (pix, mtime, size)
+        self.bytes += size
+        self.evict()
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry: self.bytes -= entry[2]
+
+    def evict(self):
+        # Always keep the most recent entry, even if it alone exceeds the budget
+        while self.bytes > self.budget and len(self.entries) > 1:
+            _, (_, _, size) = self.entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def set_budget(self, budget_bytes):
+        self.budget = budget_bytes
+        self.evict()
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries), "bytes": self.bytes, "budget": self.budget,
+            "hits": self.hits, "misses": self.misses,
+            "evictions": self.evictions, "invalidations": self.invalidations
+        }
+
+DEFAULT_ICON_CACHE_MB = 64
+ICON_CACHE = PixmapCache(DEFAULT_ICON_CACHE_MB * 1024 * 1024)
+
+def cover_crop(size, w, h):
+    # Centered w x h window inside a size that already covers w x h
+    return QRect((size.width() - w) // 2, (size.height() - h) // 2, w, h)
+
+def read_scaled_image(path, w, h, mode='fit'):
+    # Decode straight to the final size in one resample from the original; safe to call off
+    # the GUI thread. 'fit' fits inside w x h, 'cover' fills w x h and center-crops the rest.
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    src_size = reader.size()
+    cover = mode == 'cover'
+    aspect = Qt.AspectRatioMode.KeepAspectRatioByExpanding if cover else Qt.AspectRatioMode.KeepAspectRatio
+    if src_size.isValid():
+        scaled = src_size.scaled(w, h, aspect)
+        reader.setScaledSize(scaled)
+        if cover: reader.setScaledClipRect(cover_crop(scaled, w, h))
+    image = reader.read()
+    if image.isNull(): return None
+    # Formats that cannot report their size up front are scaled after decoding
+    if cover and (image.width() != w or image.height() != h):
+        image = image.scaled(w, h, aspect, Qt.TransformationMode.SmoothTransformation)
+        image = image.copy(cover_crop(image.size(), w, h))
+    elif not cover and (image.width() > w or image.height() > h):
+        image = image.scaled(w, h, aspect, Qt.TransformationMode.SmoothTransformation)
+    return image
+
+class ThumbnailCache:
+    # Pre-scaled PNGs on disk so restarts skip decoding the originals. Like the freedesktop
+    # thumbnail spec, files are named by an md5 of source path, mtime, size and render size,
+    # so a changed source simply misses and its old thumbnail ages out under the size cap.
+    def __init__(self, directory, budget_bytes):
+        self.dir = directory
+        self.budget = budget_bytes
+        self.bytes = None # Unknown until the directory is first measured
+        self.lock = threading.Lock()
+
+    def file_for(self, path, st, mode, w, h):
+        key = f"{path}|{st.st_mtime_ns}|{st.st_size}|{mode}|{w}x{h}"
+        return os.path.join(self.dir, hashlib.md5(key.encode('utf-8')).hexdigest() + ".png")
+
+    def load(self, path, st, mode, w, h):
+        thumb = self.file_for(path, st, mode, w, h)
+        if not os.path.exists(thumb): return None
+        reader = QImageReader(thumb)
+        image = reader.read()
+        if image.isNull(): return None
+        try: os.utime(thumb) # Mark as recently used for eviction
+        except OSError: pass
+        return image
+
+    def store(self, path, st, mode, w, h, image):
+        thumb = self.file_for(path, st, mode, w, h)
+        tmp = f"{thumb}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.dir, exist_ok=True)
+            if not image.save(tmp, "PNG"): return
+            os.replace(tmp, thumb)
+            size = os.path.getsize(thumb)
+        except OSError as e:
+            log.debug("thumbnail write failed for %s: %s", path, e)
+            try: os.remove(tmp)
+            except OSError: pass
+            return
+        with self.lock:
+            if self.bytes is None: self.bytes = self.measure()
+            else: self.bytes += size
+            if self.bytes > self.budget: self.prune()
+
+    def entries(self):
+        result = []
+        try:
+            with os.scandir(self.dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".png"): continue
+                    try: st = entry.stat()
+                    except OSError: continue
+                    result.append((st.st_mtime, st.st_size, entry.path))
+        except OSError: pass
+        return result
+
+    def measure(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def prune(self):
+        # Drop least recently used thumbnails until 75% of the budget is free again
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.budget * 3 // 4
+        for _, size, file_path in entries:
+            if total <= target: break
+            try: os.remove(file_path)
+            except OSError: continue
+            total -= size
+        self.bytes = total
+
+DEFAULT_THUMBNAIL_CACHE_MB = 128
+THUMBNAIL_CACHE = ThumbnailCache(os.path.join(CACHE_DIR, "thumbnails"), DEFAULT_THUMBNAIL_CACHE_MB * 1024 * 1024)
+
+def load_tile_image(path, mode, w, h):
+    # Thumbnail from disk if present, otherwise decode the original and store a thumbnail
+    try: st = os.stat(path)
+    except OSError: return None
+    image = THUMBNAIL_CACHE.load(path, st, mode, w, h)
+    if image is not None: return image
+    image = read_scaled_image(path, w, h, mode)
+    if image is not None: THUMBNAIL_CACHE.store(path, st, mode, w, h, image)
+    return image
+
+def render_key(path, w, h, mode, dpr):
+    # w and h are logical pixels; the cached pixmap is rendered at w*dpr x h*dpr
+    return (path, mode, round(w * dpr), round(h * dpr), dpr)
+
+def key_pixmap(key, image):
+    pix = QPixmap.fromImage(image)
+    pix.setDevicePixelRatio(key[4])
+    return pix
+
+def get_cached_pixmap(path, w, h, on_ready=None, mode='fit', dpr=1.0):
+    # Returns the final, ready-to-draw pixmap. Without on_ready the image is decoded synchronously.
+    # With on_ready a cache miss returns None and on_ready(pixmap_or_None) follows once decoded.
+    try: mtime = os.stat(path).st_mtime_ns
+    except OSError: return None
+    key = render_key(path, w, h, mode, dpr)
+    pix = ICON_CACHE.get(key, mtime)
+    if pix is not None: return pix
+    if on_ready is not None:
+        icon_loader().request(key, mtime, on_ready)
+        return None
+    image = load_tile_image(*key[:4])
+    if image is None: return None
+    pix = key_pixmap(key, image)
+    ICON_CACHE.put(key, pix, mtime)
+    return pix
+
+class IconDecodeTask(QRunnable):
+    def __init__(self, signals, key, mtime):
+        super().__init__()
+        self.signals = signals
+        self.key = key
+        self.mtime = mtime
+
+    def run(self):
+        self.signals.decoded.emit(self.key, self.mtime, load_tile_image(*self.key[:4]))
+
+class IconLoader(QObject):
+    # Decodes tile images on a private thread pool. Concurrent requests for the same
+    # render key share one decode; QPixmaps are only created back on the GUI thread.
+    decoded = pyqtSignal(object, object, object)
+
+    def __init__(self):
+        super().__init__()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(2, QThread.idealThreadCount() // 2))
+        self.pending = {}
+        self.decoded.connect(self.on_decoded)
+
+    def request(self, key, mtime, callback):
+        waiting = self.pending.get(key)
+        if waiting is not None:
+            waiting.append(callback)
+            return
+        self.pending[key] = [callback]
+        self.pool.start(IconDecodeTask(self, key, mtime))
+
+    def on_decoded(self, key, mtime, image):
+        pix = None
+        if image is not None:
+            pix = key_pixmap(key, image)
+            ICON_CACHE.put(key, pix, mtime)
+        for callback in self.pending.pop(key, []):
+            try: callback(pix)
+            except RuntimeError: pass # Widget was deleted while the image was decoding
+
+_ICON_LOADER = None
+
+def icon_loader():
+    global _ICON_LOADER
+    if _ICON_LOADER is None: _ICON_LOADER = IconLoader()
+    return _ICON_LOADER
+
+# --- DATA MODEL ---
+# Typed config records. The JSON layout is unchanged apart from the version-2 migration below;
+# fields are read once into slots instead of looked up with .get() on every paint, and keys a
+# record does not know are kept in 'extra' so they survive a load/save round trip.
+CONFIG_VERSION = 2 # 1 (or no version): tiles carried 'wide_tile' and a leftover 'apps': []
+
+class Model:
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        if not isinstance(data, dict): return cls()
+        # Fast path: nothing but known keys
+        if 'extra' not in data:
+            try: return cls(**data)
+            except TypeError: pass
+        obj = cls(**{k: v for k, v in data.items() if k in cls.FIELDS})
+        obj.extra = {k: v for k, v in data.items() if k not in cls.FIELDS} or None
+        return obj
+
+    def to_dict(self):
+        data = dict(zip(self.FIELDS, self.VALUES(self)))
+        if self.extra: data.update(self.extra)
+        return data
+
+    def astuple(self):
+        return self.VALUES(self)
+
+def model(cls):
+    # Compact (slotted) dataclass with identity equality, like the dicts it replaces in id() maps
+    cls = dataclass(slots=True, eq=False)(cls)
+    cls.FIELDS = tuple(f.name for f in fields(cls) if f.name != 'extra')
+    cls.VALUES = operator.attrgetter(*cls.FIELDS)
+    return cls
+
+@model
+class Tile(Model):
+    name: str = ""
+    type: str = "app" # 'app' or 'desktop'
+    script_path: str = ""
+    python_path: str = ""
+    icon: str = None
+    color: str = None # None: the default tile color
+    full_tile: bool = False
+    tile_span: str = "1x1"
+    launch_mode: str = None # None: Settings.launch_mode; else one of LAUNCH_MODES
+    extra: dict = None # unknown keys, kept for round trips
+
+@model
+class Group(Model):
+    name: str = ""
+    apps: list = field(default_factory=list) # [Tile]
+    extra: dict = None
+
+    @classmethod
+    def from_dict(cls, data):
+        group = super(Group, cls).from_dict(data)
+        group.apps = [Tile.from_dict(app) for app in group.apps or []]
+        return group
+
+    def to_dict(self, with_apps=True):
+        data = {"name": self.name}
+        if with_apps: data["apps"] = [app.to_dict() for app in self.apps]
+        if self.extra: data.update(self.extra)
+        return data
+
+@model
+class Settings(Model):
+    window_title: str = "Pop Metro Launcher"
+    background_type: str = "color"
+    background_value: str = ""
+    background_color: str = "#1d1d1d"
+    default_tile_color: str = "#00a300"
+    tile_size: int = 140
+    group_columns: int = 2
+    render_mode: str = "widgets"
+    icon_cache_mb: int = DEFAULT_ICON_CACHE_MB
+    reduced_motion: bool = False
+    storage: str = "json"
+    global_hotkey: bool = True
+    launch_mode: str = "auto" # one of LAUNCH_MODES
+    fast_start: dict = field(default_factory=dict) # python_path -> [modules to preload]
+    extra: dict = None
+
+    # What a theme carries; storage, rendering, launching and the hotkey belong to this machine
+    THEME_FIELDS = ('window_title', 'background_type', 'background_value', 'background_color',
+                    'default_tile_color', 'tile_size', 'group_columns')
+
+    def theme_dict(self):
+        return {name: getattr(self, name) for name in self.THEME_FIELDS}
+
+    def with_theme(self, data):
+        # These settings with a theme's appearance fields laid over them
+        if not isinstance(data, dict): return self
+        return replace(self, **{name: data[name] for name in self.THEME_FIELDS if name in data})
+
+@model
+class StartButtonSettings(Model):
+    visible: bool = True
+    autohide: bool = False
+    position: str = "Bottom Left"
+    size: int = 60
+    icon_type: str = "text"
+    icon_val: str = "❖"
+    color: str = "rgba(255, 255, 255, 0.2)"
+    extra: dict = None
+
+@model
+class Config(Model):
+    version: int = CONFIG_VERSION
+    settings: Settings = field(default_factory=Settings)
+    start_btn: StartButtonSettings = field(default_factory=StartButtonSettings)
+    groups: list = field(default_factory=list) # [Group]
+    recent_themes: list = field(default_factory=list) # theme documents, kept as plain dicts
+    extra: dict = None
+
+    @classmethod
+    def from_dict(cls, data):
+        data = migrate_config(data)
+        config = super(Config, cls).from_dict(data)
+        config.version = CONFIG_VERSION
+        config.settings = Settings.from_dict(config.settings)
+        config.start_btn = StartButtonSettings.from_dict(config.start_btn)
+        if not isinstance(config.settings.fast_start, dict): config.settings.fast_start = {}
+        config.groups = [Group.from_dict(g) for g in config.groups or []]
+        if not isinstance(config.recent_themes, list): config.recent_themes = []
+        return config
+
+    def sections(self):
+        # Everything except groups and recent themes, as JSON-ready values
+        data = {"version": self.version, "settings": self.settings.to_dict(), "start_btn": self.start_btn.to_dict()}
+        if self.extra: data.update(self.extra)
+        return data
+
+    def to_dict(self):
+        data = self.sections()
+        data["groups"] = [g.to_dict() for g in self.groups]
+        data["recent_themes"] = self.recent_themes
+        return data
+
+def migrate_config(data):
+    # Upgrade a config document in place to CONFIG_VERSION
+    if not isinstance(data, dict): return {}
+    version = data.get('version', 1)
+    if not isinstance(version, int) or version < 2:
+        for group in data.get('groups') or []:
+            for app in (group.get('apps') or []) if isinstance(group, dict) else []:
+                if not isinstance(app, dict): continue
+                wide = app.pop('wide_tile', False)
+                if not app.get('tile_span'): app['tile_span'] = "2x1" if wide else "1x1"
+                # Tiles used to carry an always-empty 'apps' list from the old folder tiles
+                if not app.get('apps'): app.pop('apps', None)
+    data['version'] = CONFIG_VERSION
+    return data
 
 # --- HELPER: Floating "Start" Button ---
 class FloatingStartButton(QWidget):
@@ -43,6 +523,7 @@ class FloatingStartButton(QWidget):
         self.btn.clicked.connect(self.safe_toggle)
         self.layout.addWidget(self.btn)
         
+        self.applied = None
         self.apply_settings()
 
     def safe_toggle(self):
@@ -50,23 +531,25 @@ class FloatingStartButton(QWidget):
             self.parent_window.toggle_visibility()
 
     def apply_settings(self):
-        settings = self.parent_window.config.get('start_btn', {
-            'visible': True, 'size': 60, 'position': 'Bottom Left', 
-            'color': 'rgba(255, 255, 255, 0.2)', 'icon_type': 'text', 'icon_val': '❖'
-        })
+        settings = self.parent_window.config.start_btn
         
-        if not settings.get('visible', True):
+        if not settings.visible:
             self.hide()
             return
         elif not self.parent_window.isVisible():
             self.show()
 
-        height = settings.get('size', 60)
-        pos_str = settings.get('position', 'Bottom Left')
-        autohide = settings.get('autohide', False)
+        # Restyling is only needed when the settings or the screen changed, not on every hide
+        applied = (settings.astuple(), QApplication.primaryScreen().geometry())
+        if applied == self.applied: return
+        self.applied = applied
+
+        height = settings.size
+        pos_str = settings.position
+        autohide = settings.autohide
         
-        icon_type = settings.get('icon_type', 'text')
-        icon_val = settings.get('icon_val', '❖')
+        icon_type = settings.icon_type
+        icon_val = settings.icon_val
         
         width = height 
         
@@ -99,7 +582,7 @@ class FloatingStartButton(QWidget):
             
         self.move(x, y)
         
-        bg_color = settings.get('color', 'rgba(255, 255, 255, 0.2)')
+        bg_color = settings.color
         
         radius = "10px"
         corners = ""
@@ -149,174 +632,30 @@ class FloatingStartButton(QWidget):
             }}
         """)
 
-# --- HELPER: App Importer ---
-class AppImporterDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-        self.setWindowTitle("Import Applications")
-        self.resize(500, 600)
-        self.layout = QVBoxLayout(self)
-        
-        self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("Search apps...")
-        self.search_bar.textChanged.connect(self.filter_list)
-        self.layout.addWidget(self.search_bar)
-
-        self.list_widget = QListWidget()
-        self.layout.addWidget(self.list_widget)
-        
-        self.icon_check = QCheckBox("Import System Icon")
-        self.icon_check.setChecked(True) 
-        self.layout.addWidget(self.icon_check)
-        
-        self.btn_box = QHBoxLayout()
-        import_btn = QPushButton("Import")
-        import_btn.clicked.connect(self.accept)
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        self.btn_box.addWidget(import_btn)
-        self.btn_box.addWidget(cancel_btn)
-        self.layout.addLayout(self.btn_box)
-        
-        self.system_apps = []
-        self.load_system_apps()
-
-    def load_system_apps(self):
-        paths = [
-            "/usr/share/applications",
-            os.path.expanduser("~/.local/share/applications"),
-            "/var/lib/flatpak/exports/share/applications",          
-            os.path.expanduser("~/.local/share/flatpak/exports/share/applications"), 
-            "/var/lib/snapd/desktop/applications"                   
-        ]
-        unique_names = set()
-        for path in paths:
-            if not os.path.exists(path): continue
-            
-            # Walk strictly (no recursive subfolders to avoid snap junk) or just listdir
-            # Using os.walk allows finding apps in subdirs like /kde or /wine
-            for root, _, files in os.walk(path):
-                for file in files:
-                    if file.endswith(".desktop"):
-                        try:
-                            data = self.parse_desktop_file(os.path.join(root, file))
-                            if data:
-                                # Use name + exec as unique key to prevent duplicates
-                                key = f"{data['name']}|{data['exec']}"
-                                if key not in unique_names:
-                                    self.system_apps.append(data)
-                                    unique_names.add(key)
-                        except: pass
-                        
-        self.system_apps.sort(key=lambda x: x['name'].lower())
-        self.populate_list(self.system_apps)
-
-    def parse_desktop_file(self, path):
-        name = None
-        loc_name = None 
-        exec_cmd = None
-        icon = None
-        no_display = False
-        hidden = False
-        
-        # Flag to track if we are inside the main [Desktop Entry] section
-        in_main_section = False
-        
-        try:
-            with open(path, 'r', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'): continue
-                    
-                    # Check for Section Headers
-                    if line.startswith('['):
-                        if line == "[Desktop Entry]":
-                            in_main_section = True
-                            continue
-                        else:
-                            # If we hit ANY other section (like [Desktop Action...]), STOP reading
-                            if in_main_section: 
-                                break 
-                            else:
-                                continue # Skip lines until we find [Desktop Entry]
-
-                    # Only parse lines if we are inside the main section
-                    if in_main_section and "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        if key == "Name": name = value
-                        elif key.startswith("Name["): loc_name = value 
-                        elif key == "Exec": exec_cmd = value
-                        elif key == "Icon": icon = value
-                        elif key == "NoDisplay" and value.lower() == "true": no_display = True
-                        elif key == "Hidden" and value.lower() == "true": hidden = True
-                        elif key == "Type" and value.lower() != "application": return None 
-        except:
-            return None
-
-        if no_display or hidden: return None
-        
-        final_name = name if name else loc_name
-        if not final_name or not exec_cmd: return None
-        
-        # Clean Exec command
-        exec_cmd = exec_cmd.split('%')[0].strip()
-        
-        return {"name": final_name, "exec": exec_cmd, "icon_name": icon, "path": path}
-
-def populate_list(self, apps):
-        self.list_widget.clear()
-        for app in apps:
-            item = QListWidgetItem(app['name'])
-            if app['icon_name']:
-                icon = QIcon.fromTheme(app['icon_name'])
-                if not icon.isNull(): item.setIcon(icon)
-            item.setData(Qt.ItemDataRole.UserRole, app)
-            self.list_widget.addItem(item)
-
-def filter_list(self, text):
-        filtered = [app for app in self.system_apps if text.lower() in app['name'].lower()]
-        self.populate_list(filtered)
-
-def get_selected_app(self):
-        item = self.list_widget.currentItem()
-        if item: return item.data(Qt.ItemDataRole.UserRole)
-        return None
-def load_system_apps(self):
-        paths = [
-            "/usr/share/applications",
-            os.path.expanduser("~/.local/share/applications"),
-            "/var/lib/flatpak/exports/share/applications",          
-            os.path.expanduser("~/.local/share/flatpak/exports/share/applications"), 
-            "/var/lib/snapd/desktop/applications"                   
-        ]
-        unique_names = set()
-        for path in paths:
-            if not os.path.exists(path): continue
-            for file in os.listdir(path):
-                if file.endswith(".desktop"):
-                    try:
-                        data = self.parse_desktop_file(os.path.join(path, file))
-                        if data and data['name'] and data['name'] not in unique_names:
-                            self.system_apps.append(data)
-                            unique_names.add(data['name'])
-                    except: pass
-        self.system_apps.sort(key=lambda x: x['name'])
-        self.populate_list(self.system_apps)
-def parse_desktop_file(self, path):
-        name = None
-        loc_name = None 
-        exec_cmd = None
-        icon = None
-        no_display = False
-        hidden = False
-        
-        # Flag to track if we are inside the main [Desktop Entry] section
-        in_main_section = False
-        
+# --- SYSTEM APPS: Desktop Entry Index ---
+
+APP_DIRS = [
+    "/usr/share/applications",
+    os.path.expanduser("~/.local/share/applications"),
+    "/var/lib/flatpak/exports/share/applications",
+    os.path.expanduser("~/.local/share/flatpak/exports/share/applications"),
+    "/var/lib/snapd/desktop/applications"
+]
+
+_INDEX_LOCK = threading.Lock()
+
+def parse_desktop_file(path):
+    name = None
+    loc_name = None 
+    exec_cmd = None
+    icon = None
+    no_display = False
+    hidden = False
+    
+    # Flag to track if we are inside the main [Desktop Entry] section
+    in_main_section = False
+    
+    try:
         with open(path, 'r', errors='ignore') as f:
             for line in f:
                 line = line.strip()
@@ -347,33 +686,743 @@ def parse_desktop_file(self, path):
                     elif key == "NoDisplay" and value.lower() == "true": no_display = True
                     elif key == "Hidden" and value.lower() == "true": hidden = True
                     elif key == "Type" and value.lower() != "application": return None 
+    except:
+        return None
+
+    if no_display or hidden: return None
+    
+    final_name = name if name else loc_name
+    if not final_name or not exec_cmd: return None
+    
+    # Clean Exec command
+    exec_cmd = exec_cmd.split('%')[0].strip()
+    
+    return {"name": final_name, "exec": exec_cmd, "icon_name": icon, "path": path}
+
+class DesktopIndex:
+    # On-disk index of parsed .desktop files: path -> [mtime_ns, size, entry].
+    # Only files whose mtime/size changed since the last scan are re-parsed.
+    VERSION = 1
 
-        if no_display or hidden: return None
+    def __init__(self, index_file=None):
+        self.index_file = index_file or os.path.join(CACHE_DIR, "desktop_index.json")
+        self.files = {}
+        self.scanned_dirs = set()
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.index_file, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                self.files = data.get('files', {})
+        except (OSError, ValueError):
+            self.files = {}
+
+    def save(self):
+        with _INDEX_LOCK:
+            try:
+                os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+                tmp = self.index_file + ".tmp"
+                with open(tmp, 'w') as f:
+                    json.dump({"version": self.VERSION, "files": self.files}, f)
+                os.replace(tmp, self.index_file)
+            except OSError:
+                pass
+
+    def iter_scan(self, dirs=None, batch_size=64):
+        # Yields new unique app entries in batches while walking, then updates the index
+        seen = {}
+        dirty = False
+        unique_names = set()
+        batch = []
+        scanned_dirs = set()
+        for path in (dirs or APP_DIRS):
+            if not os.path.exists(path): continue
+            
+            # Using os.walk allows finding apps in subdirs like /kde or /wine
+            for root, _, files in os.walk(path):
+                scanned_dirs.add(root)
+                for file in files:
+                    if not file.endswith(".desktop"): continue
+                    full_path = os.path.join(root, file)
+                    try: st = os.stat(full_path)
+                    except OSError: continue
+                    
+                    cached = self.files.get(full_path)
+                    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                        seen[full_path] = cached
+                    else:
+                        seen[full_path] = [st.st_mtime_ns, st.st_size, parse_desktop_file(full_path)]
+                        dirty = True
+                    
+                    data = seen[full_path][2]
+                    if not data: continue
+                    # Use name + exec as unique key to prevent duplicates
+                    key = f"{data['name']}|{data['exec']}"
+                    if key in unique_names: continue
+                    unique_names.add(key)
+                    batch.append(data)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+        if batch:
+            yield batch
+        
+        self.scanned_dirs = scanned_dirs
+        # Entries of deleted files are dropped by only keeping what this scan saw
+        if dirty or len(seen) != len(self.files):
+            self.files = seen
+            self.save()
+
+    def rescan_dir(self, dir_path):
+        # Re-stat a single directory (non-recursive); returns (changed, new_subdirs)
+        changed = False
+        subdirs = []
+        present = set()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            subdirs.append(entry.path)
+                            continue
+                        if not entry.name.endswith(".desktop"): continue
+                        st = entry.stat()
+                    except OSError: continue
+                    present.add(entry.path)
+                    cached = self.files.get(entry.path)
+                    if not (cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size):
+                        self.files[entry.path] = [st.st_mtime_ns, st.st_size, parse_desktop_file(entry.path)]
+                        changed = True
+        except OSError:
+            pass
         
-        final_name = name if name else loc_name
-        if not final_name or not exec_cmd: return None
+        # Drop files that vanished from this directory, or everything below it if it is gone
+        gone_dir = not os.path.isdir(dir_path)
+        prefix = dir_path.rstrip('/') + '/'
+        for path in list(self.files):
+            if gone_dir:
+                if not path.startswith(prefix): continue
+            elif os.path.dirname(path) != dir_path or path in present:
+                continue
+            del self.files[path]
+            changed = True
+        return changed, subdirs
+
+    def scan(self, dirs=None):
+        for _ in self.iter_scan(dirs): pass
+        return self.apps()
+
+    def apps(self):
+        apps = []
+        unique_names = set()
+        for _, _, data in self.files.values():
+            if not data: continue
+            key = f"{data['name']}|{data['exec']}"
+            if key not in unique_names:
+                apps.append(data)
+                unique_names.add(key)
+        apps.sort(key=lambda x: x['name'].lower())
+        return apps
+
+class AppSearchIndex:
+    # Pre-lowercased search keys (name, Exec and .desktop filename) plus a trigram
+    # index. A query that contains the previous one only re-checks the previous hits.
+    def __init__(self):
+        self.apps = {}
+        self.keys = {}
+        self.trigrams = {}
+        self.last_query = None
+        self.last_result = None
+
+    @staticmethod
+    def grams(text):
+        return {text[i:i+3] for i in range(len(text) - 2)}
+
+    def add(self, app):
+        path = app['path']
+        if path in self.keys: self.remove(app)
+        key = "\n".join((app['name'], app['exec'], os.path.basename(path))).lower()
+        self.apps[path] = app
+        self.keys[path] = key
+        for gram in self.grams(key):
+            self.trigrams.setdefault(gram, set()).add(path)
+        self.last_query = None
+
+    def remove(self, app):
+        self.apps.pop(app['path'], None)
+        key = self.keys.pop(app['path'], None)
+        if key is None: return
+        for gram in self.grams(key):
+            paths = self.trigrams.get(gram)
+            if paths is not None:
+                paths.discard(app['path'])
+                if not paths: del self.trigrams[gram]
+        self.last_query = None
+
+    def matches(self, app, query):
+        key = self.keys.get(app['path'])
+        return key is not None and query in key
+
+    def search(self, query):
+        # Returns the set of matching .desktop paths, or None when everything matches
+        query = query.lower()
+        if not query: return None
+        if self.last_query and self.last_query in query:
+            candidates = self.last_result
+        elif len(query) >= 3:
+            sets = sorted((self.trigrams.get(g, ()) for g in self.grams(query)), key=len)
+            candidates = sets[0]
+            for other in sets[1:]:
+                if not candidates: break
+                candidates = candidates & other
+        else:
+            candidates = self.keys
+        keys = self.keys
+        result = {p for p in candidates if query in keys[p]}
+        self.last_query = query
+        self.last_result = result
+        return set(result)
+
+class AppScanSignals(QObject):
+    batch = pyqtSignal(list)
+    finished = pyqtSignal()
+
+class AppScanWorker(QRunnable):
+    # Runs DesktopIndex.iter_scan on the global thread pool and streams batches back
+    def __init__(self, index=None, batch_size=64):
+        super().__init__()
+        self.index = index or DesktopIndex()
+        self.batch_size = batch_size
+        self.signals = AppScanSignals()
+        self.cancelled = False
+
+    def run(self):
+        for batch in self.index.iter_scan(batch_size=self.batch_size):
+            if self.cancelled: return
+            self.signals.batch.emit(batch)
+        self.signals.finished.emit()
+
+class AppCatalog(QObject):
+    # Long-lived, in-memory view of the installed applications.
+    # The initial scan streams in from the thread pool; afterwards a QFileSystemWatcher
+    # reports changed directories, which are collected and re-scanned in one batch.
+    apps_added = pyqtSignal(list)
+    apps_removed = pyqtSignal(list)
+    scan_finished = pyqtSignal()
+
+    COALESCE_MS = 500
+    MAX_DELAY_MS = 3000
+
+    def __init__(self, parent=None, watch=True):
+        super().__init__(parent)
+        self.index = DesktopIndex()
+        self.watch = watch
+        self.is_ready = False
+        self._apps = {}
+        self.search_index = AppSearchIndex()
+        self._pending_dirs = set()
+        self._pending_since = None
+        self.scan_worker = None
         
-        exec_cmd = exec_cmd.split('%')[0].strip()
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.on_directory_changed)
         
-        return {"name": final_name, "exec": exec_cmd, "icon_name": icon, "path": path}
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self.flush_changes)
+
+    def start(self):
+        self.scan_worker = AppScanWorker(self.index)
+        self.scan_worker.signals.batch.connect(self.on_batch)
+        self.scan_worker.signals.finished.connect(self.on_scan_finished)
+        QThreadPool.globalInstance().start(self.scan_worker)
+
+    def stop(self):
+        if self.scan_worker: self.scan_worker.cancelled = True
+        self.flush_timer.stop()
 
-def populate_list(self, apps):
-        self.list_widget.clear()
+    def apps(self):
+        return sorted(self._apps.values(), key=lambda x: x['name'].lower())
+
+    def on_batch(self, apps):
         for app in apps:
-            item = QListWidgetItem(app['name'])
+            self._apps[f"{app['name']}|{app['exec']}"] = app
+            self.search_index.add(app)
+        self.apps_added.emit(apps)
+
+    def on_scan_finished(self):
+        self.is_ready = True
+        if self.watch:
+            self.update_watches(self.index.scanned_dirs)
+        self.scan_finished.emit()
+
+    def update_watches(self, dirs=()):
+        watched = set(self.watcher.directories())
+        new_dirs = [d for d in dirs if d not in watched]
+        # Missing application roots (e.g. Flatpak not installed yet): watch the closest parent
+        for root in APP_DIRS:
+            if os.path.isdir(root):
+                if root not in watched and root not in new_dirs: new_dirs.append(root)
+                continue
+            parent = os.path.dirname(root)
+            while parent and parent != '/' and not os.path.isdir(parent):
+                parent = os.path.dirname(parent)
+            if parent and parent != '/' and parent not in watched and parent not in new_dirs:
+                new_dirs.append(parent)
+        if new_dirs: self.watcher.addPaths(new_dirs)
+
+    def on_directory_changed(self, path):
+        self._pending_dirs.add(path)
+        now = time.monotonic()
+        if self._pending_since is None: self._pending_since = now
+        # Restart the quiet period for each event, but never delay a burst beyond MAX_DELAY_MS
+        if (now - self._pending_since) * 1000 < self.MAX_DELAY_MS:
+            self.flush_timer.start(self.COALESCE_MS)
+
+    def flush_changes(self):
+        pending = self._pending_dirs
+        self._pending_dirs = set()
+        self._pending_since = None
+        
+        changed = False
+        new_dirs = []
+        app_roots = [r.rstrip('/') + '/' for r in APP_DIRS]
+        for dir_path in pending:
+            inside = any((dir_path + '/').startswith(r) for r in app_roots)
+            if not inside:
+                # A watched parent of a missing root: pick up roots that appeared
+                for root in APP_DIRS:
+                    if os.path.isdir(root) and root not in self.watcher.directories():
+                        for sub_root, _, _ in os.walk(root):
+                            dir_changed, _ = self.index.rescan_dir(sub_root)
+                            changed |= dir_changed
+                            new_dirs.append(sub_root)
+                continue
+            dir_changed, subdirs = self.index.rescan_dir(dir_path)
+            changed |= dir_changed
+            for sub in subdirs:
+                if sub not in self.watcher.directories():
+                    for sub_root, _, _ in os.walk(sub):
+                        dir_changed, _ = self.index.rescan_dir(sub_root)
+                        changed |= dir_changed
+                        new_dirs.append(sub_root)
+        
+        self.update_watches(new_dirs)
+        if not changed: return
+        self.index.save()
+        
+        current = {f"{a['name']}|{a['exec']}": a for a in self.index.apps()}
+        removed = [a for k, a in self._apps.items() if current.get(k) != a]
+        added = [a for k, a in current.items() if self._apps.get(k) != a]
+        self._apps = current
+        for app in removed: self.search_index.remove(app)
+        for app in added: self.search_index.add(app)
+        if removed: self.apps_removed.emit(removed)
+        if added: self.apps_added.emit(added)
+
+# --- SYSTEM APPS: Icon Theme Index ---
+ICON_EXTENSIONS = ('.png', '.svg', '.xpm')
+
+def icon_base_dirs():
+    # Icon search path from the freedesktop spec, followed by Flatpak exports
+    data_home = os.environ.get('XDG_DATA_HOME') or os.path.expanduser("~/.local/share")
+    data_dirs = os.environ.get('XDG_DATA_DIRS') or "/usr/local/share:/usr/share"
+    dirs = [os.path.expanduser("~/.icons"), os.path.join(data_home, "icons")]
+    dirs += [os.path.join(d, "icons") for d in data_dirs.split(':') if d]
+    dirs += [os.path.join(data_home, "flatpak/exports/share/icons"),
+             "/var/lib/flatpak/exports/share/icons"]
+    return list(dict.fromkeys(dirs))
+
+def parse_index_theme(path):
+    # Returns (inherits, {subdir: (size_px, scalable)}) from an index.theme file
+    sections = {}
+    current = None
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith('[') and line.endswith(']'):
+                    current = sections.setdefault(line[1:-1], {})
+                elif current is not None and '=' in line:
+                    key, value = line.split('=', 1)
+                    current[key.strip()] = value.strip()
+    except OSError:
+        return [], {}
+    main = sections.get('Icon Theme', {})
+    inherits = [t.strip() for t in main.get('Inherits', '').split(',') if t.strip()]
+    subdirs = {}
+    names = main.get('Directories', '') + ',' + main.get('ScaledDirectories', '')
+    for name in dict.fromkeys(n.strip() for n in names.split(',') if n.strip()):
+        info = sections.get(name, {})
+        try: size = int(info.get('Size', 0)) * int(info.get('Scale', 1))
+        except ValueError: size = 0
+        subdirs[name] = (size, info.get('Type', 'Threshold') == 'Scalable')
+    return inherits, subdirs
+
+def guess_subdirs(theme_dir):
+    # Flatpak exports ship bare hicolor trees (<size>/<context>) without an index.theme
+    subdirs = {}
+    try: size_names = [e.name for e in os.scandir(theme_dir) if e.is_dir()]
+    except OSError: return subdirs
+    for size_name in size_names:
+        scalable = size_name == 'scalable'
+        size = 0
+        if not scalable:
+            base, _, scale = size_name.partition('@')
+            try: size = int(base.split('x')[0]) * int(scale or 1)
+            except ValueError: continue
+        try: contexts = os.listdir(os.path.join(theme_dir, size_name))
+        except OSError: continue
+        for context in contexts:
+            subdirs[f"{size_name}/{context}"] = (size, scalable)
+    return subdirs
+
+class IconThemeIndex:
+    # Icon name -> files index for the current theme and everything it inherits, so
+    # resolving a name is a dict lookup instead of Qt walking the theme directories.
+    # Fallback chain: theme, its Inherits (depth first), hicolor (including Flatpak
+    # exports), then /usr/share/pixmaps. Persisted and rebuilt when a directory mtime changes.
+    VERSION = 1
+
+    def __init__(self, theme=None, index_file=None):
+        self.theme = theme or QIcon.themeName() or "hicolor"
+        self.index_file = index_file or os.path.join(CACHE_DIR, "icon_theme_index.json")
+        self.dirs = []  # [path, size_px, scalable]
+        self.icons = {} # name -> [[dir_index, ext], ...] for the first theme in the chain providing it
+        self.mtimes = {}
+        if not self.load():
+            self.build()
+            self.save()
+
+    @staticmethod
+    def mtime(path):
+        try: return os.stat(path).st_mtime_ns
+        except OSError: return None
+
+    def load(self):
+        try:
+            with open(self.index_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != self.VERSION or data.get('theme') != self.theme: return False
+        mtimes = data.get('mtimes', {})
+        for path, mtime in mtimes.items():
+            if self.mtime(path) != mtime: return False
+        self.dirs = data.get('dirs', [])
+        self.icons = data.get('icons', {})
+        self.mtimes = mtimes
+        return True
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+            tmp = self.index_file + ".tmp"
+            with open(tmp, 'w') as f:
+                json.dump({"version": self.VERSION, "theme": self.theme, "mtimes": self.mtimes,
+                           "dirs": self.dirs, "icons": self.icons}, f)
+            os.replace(tmp, self.index_file)
+        except OSError:
+            pass
+
+    def theme_chain(self, bases):
+        chain = []
+        pending = [self.theme]
+        while pending:
+            name = pending.pop(0)
+            if name in chain: continue
+            chain.append(name)
+            for base in bases:
+                index_theme = os.path.join(base, name, "index.theme")
+                if os.path.isfile(index_theme):
+                    pending[0:0] = parse_index_theme(index_theme)[0]
+                    break
+        if "hicolor" not in chain: chain.append("hicolor")
+        return chain
+
+    def build(self):
+        start = time.perf_counter()
+        bases = icon_base_dirs()
+        self.dirs, self.icons, self.mtimes = [], {}, {}
+        for base in bases:
+            # Watching the roots notices newly installed themes
+            self.mtimes[base] = self.mtime(base)
+        for theme in self.theme_chain(bases):
+            found = {}
+            for base in bases:
+                theme_dir = os.path.join(base, theme)
+                subdirs = parse_index_theme(os.path.join(theme_dir, "index.theme"))[1]
+                if not subdirs and theme == "hicolor": subdirs = guess_subdirs(theme_dir)
+                for sub, (size, scalable) in subdirs.items():
+                    self.add_dir(os.path.join(theme_dir, sub), size, scalable, found)
+            for name, entries in found.items():
+                self.icons.setdefault(name, entries)
+        pixmaps = {}
+        self.add_dir("/usr/share/pixmaps", 0, False, pixmaps)
+        for name, entries in pixmaps.items():
+            self.icons.setdefault(name, entries)
+        log.debug("icon theme index: %s, %d names in %.1f ms", self.theme, len(self.icons),
+                  (time.perf_counter() - start) * 1000)
+
+    def add_dir(self, path, size, scalable, target):
+        try:
+            with os.scandir(path) as it:
+                files = [e.name for e in it]
+        except OSError:
+            return
+        self.mtimes[path] = self.mtime(path)
+        dir_index = len(self.dirs)
+        self.dirs.append([path, size, scalable])
+        for file_name in files:
+            stem, ext = os.path.splitext(file_name)
+            if ext not in ICON_EXTENSIONS: continue
+            target.setdefault(stem, []).append([dir_index, ext])
+
+    def lookup(self, name, size_px=48):
+        # Best file for name at size_px: exact size, else scalable, else the smallest larger, else the largest
+        if not name: return None
+        if name not in self.icons:
+            # Some desktop files name the icon with its extension
+            stem, ext = os.path.splitext(name)
+            if ext in ICON_EXTENSIONS: name = stem
+        entries = self.icons.get(name)
+        if not entries: return None
+        best = None
+        best_rank = None
+        for dir_index, ext in entries:
+            path, size, scalable = self.dirs[dir_index]
+            if size == size_px: rank = (0, 0)
+            elif scalable: rank = (1, 0)
+            elif size > size_px: rank = (2, size)
+            else: rank = (3, -size)
+            if ext == '.xpm': rank = (rank[0] + 4, rank[1])
+            if best_rank is None or rank < best_rank:
+                best, best_rank = os.path.join(path, name + ext), rank
+        return best
+
+_ICON_THEME_INDEX = None
+
+def icon_theme_index():
+    global _ICON_THEME_INDEX
+    if _ICON_THEME_INDEX is None: _ICON_THEME_INDEX = IconThemeIndex()
+    return _ICON_THEME_INDEX
+
+# --- HELPER: App Importer ---
+THEME_ICON_CACHE = {}
+
+def get_theme_icon(name):
+    icon = THEME_ICON_CACHE.get(name)
+    if icon is None:
+        # Desktop entries may name an image file directly (AppImage, Steam, Flatpak)
+        path = name if os.path.isabs(name) else icon_theme_index().lookup(name, 32)
+        icon = QIcon(path) if path else QIcon()
+        THEME_ICON_CACHE[name] = icon
+    return icon
+
+class AppListModel(QAbstractListModel):
+    # Sorted list of app entries. Icons are resolved only when a view asks for
+    # DecorationRole, i.e. for rows that are actually painted.
+    AppRole = Qt.ItemDataRole.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.apps = []
+        self.sort_keys = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.apps)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        app = self.apps[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return app['name']
+        if role == Qt.ItemDataRole.DecorationRole:
             if app['icon_name']:
-                icon = QIcon.fromTheme(app['icon_name'])
-                if not icon.isNull(): item.setIcon(icon)
-            item.setData(Qt.ItemDataRole.UserRole, app)
-            self.list_widget.addItem(item)
-
-def filter_list(self, text):
-        filtered = [app for app in self.system_apps if text.lower() in app['name'].lower()]
-        self.populate_list(filtered)
-
-def get_selected_app(self):
-        item = self.list_widget.currentItem()
-        if item: return item.data(Qt.ItemDataRole.UserRole)
+                icon = get_theme_icon(app['icon_name'])
+                if not icon.isNull(): return icon
+            return None
+        if role == self.AppRole:
+            return app
+        return None
+
+    def add_apps(self, apps):
+        for app in apps:
+            key = app['name'].lower()
+            i = bisect.bisect_right(self.sort_keys, key)
+            self.beginInsertRows(QModelIndex(), i, i)
+            self.sort_keys.insert(i, key)
+            self.apps.insert(i, app)
+            self.endInsertRows()
+
+    def row_of(self, app):
+        key = app['name'].lower()
+        lo = bisect.bisect_left(self.sort_keys, key)
+        hi = bisect.bisect_right(self.sort_keys, key)
+        for i in range(lo, hi):
+            if self.apps[i]['path'] == app['path']: return i
+        return -1
+
+    def remove_apps(self, apps):
+        for app in apps:
+            i = self.row_of(app)
+            if i < 0: continue
+            self.beginRemoveRows(QModelIndex(), i, i)
+            del self.apps[i]
+            del self.sort_keys[i]
+            self.endRemoveRows()
+
+    def notify_rows(self, apps):
+        # dataChanged over contiguous runs makes a dynamic proxy re-filter only these rows
+        rows = sorted(r for r in (self.row_of(app) for app in apps) if r >= 0)
+        start = prev = None
+        for r in rows + [None]:
+            if r is not None and prev is not None and r == prev + 1:
+                prev = r
+                continue
+            if start is not None:
+                self.dataChanged.emit(self.index(start), self.index(prev))
+            start = prev = r
+
+class AppFilterProxy(QSortFilterProxyModel):
+    # Accepts rows whose .desktop path is in the current match set (None = all).
+    # The dialog re-filters only rows whose membership changed.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.matches = None
+        self.source_apps = []
+
+    def setSourceModel(self, model):
+        self.source_apps = model.apps
+        super().setSourceModel(model)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        matches = self.matches
+        return matches is None or self.source_apps[source_row]['path'] in matches
+
+class AppImporterDialog(QDialog):
+    def __init__(self, parent=None, catalog=None):
+        super().__init__(parent)
+        self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
+        self.setWindowTitle("Import Applications")
+        self.resize(500, 600)
+        self.layout = QVBoxLayout(self)
+        
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Search apps...")
+        self.search_bar.textChanged.connect(self.schedule_filter)
+        self.layout.addWidget(self.search_bar)
+        
+        # Debounce keystrokes so fast typing runs one search per pause
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(80)
+        self.filter_timer.timeout.connect(lambda: self.filter_list(self.search_bar.text()))
+
+        self.model = AppListModel(self)
+        self.proxy = AppFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.list_view = QListView()
+        # Uniform sizes keep the view from querying every row (and its icon) for size hints
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setIconSize(QSize(24, 24))
+        self.list_view.setModel(self.proxy)
+        self.layout.addWidget(self.list_view)
+        
+        self.status_label = QLabel("Scanning applications...")
+        self.status_label.setStyleSheet("color: #888;")
+        self.layout.addWidget(self.status_label)
+        
+        self.icon_check = QCheckBox("Import System Icon")
+        self.icon_check.setChecked(True) 
+        self.layout.addWidget(self.icon_check)
+        
+        self.btn_box = QHBoxLayout()
+        import_btn = QPushButton("Import")
+        import_btn.clicked.connect(self.accept)
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        self.btn_box.addWidget(import_btn)
+        self.btn_box.addWidget(cancel_btn)
+        self.layout.addLayout(self.btn_box)
+        
+        self.catalog = catalog
+        self.owns_catalog = catalog is None
+        self._detached = False # done() ran; it can run again (accept, then the close that follows)
+        self.load_system_apps()
+
+    @property
+    def system_apps(self):
+        return self.model.apps
+
+    def load_system_apps(self):
+        # Without the launcher's live catalog, scan privately on the thread pool.
+        # Either way the dialog is usable immediately and fills in as entries arrive.
+        if self.owns_catalog:
+            self.catalog = AppCatalog(self, watch=False)
+        self.catalog.apps_added.connect(self.add_apps)
+        self.catalog.apps_removed.connect(self.remove_apps)
+        self.catalog.scan_finished.connect(self.on_scan_finished)
+        if self.owns_catalog:
+            self.catalog.start()
+        else:
+            self.add_apps(self.catalog.apps())
+            if self.catalog.is_ready: self.on_scan_finished()
+
+    def add_apps(self, apps):
+        if self.proxy.matches is not None:
+            query = self.search_bar.text().lower()
+            for app in apps:
+                if self.catalog.search_index.matches(app, query): self.proxy.matches.add(app['path'])
+        self.model.add_apps(apps)
+        self.status_label.setText(f"Scanning applications... {len(self.model.apps)} found")
+
+    def remove_apps(self, apps):
+        self.model.remove_apps(apps)
+
+    def on_scan_finished(self):
+        self.status_label.hide()
+
+    def done(self, result):
+        if not self._detached:
+            self._detached = True
+            self.catalog.apps_added.disconnect(self.add_apps)
+            self.catalog.apps_removed.disconnect(self.remove_apps)
+            self.catalog.scan_finished.disconnect(self.on_scan_finished)
+            if self.owns_catalog: self.catalog.stop()
+        super().done(result)
+
+    def schedule_filter(self, text):
+        self.filter_timer.start()
+
+    def filter_list(self, text):
+        # Works on whatever the background scan has delivered so far
+        old = self.proxy.matches
+        new = self.catalog.search_index.search(text)
+        self.proxy.matches = new
+        if old is None and new is None: return
+        
+        if old is None or new is None:
+            changed_count = len(self.model.apps) - len(old if new is None else new)
+        else:
+            changed = old ^ new
+            changed_count = len(changed)
+        # Large swings are cheaper as one full pass than as many row notifications
+        if changed_count > len(self.model.apps) // 16:
+            self.proxy.invalidate()
+            return
+        if old is None or new is None:
+            keep = new if old is None else old
+            changed = {app['path'] for app in self.model.apps} - keep
+        apps = self.catalog.search_index.apps
+        self.model.notify_rows([apps[p] for p in changed if p in apps])
+
+    def get_selected_app(self):
+        index = self.list_view.currentIndex()
+        if index.isValid(): return self.proxy.data(index, AppListModel.AppRole)
         return None
 
 # --- HELPER: App Editor Dialog ---
@@ -384,11 +1433,12 @@ class AppEditorDialog(QDialog):
         self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
         self.setWindowTitle("Properties")
         self.setFixedWidth(400)
-        self.app_data = app_data or {}
+        self.app_data = app_data or Tile()
+        self.icon = self.app_data.icon
         
         layout = QFormLayout(self)
         
-        self.name_input = QLineEdit(self.app_data.get('name', ''))
+        self.name_input = QLineEdit(self.app_data.name)
         layout.addRow("Name:", self.name_input)
         
         # 1. Primary Mode Selection
@@ -409,7 +1459,7 @@ class AppEditorDialog(QDialog):
         path_layout = QFormLayout(self.grp_paths)
         path_layout.setContentsMargins(0,0,0,0)
 
-        self.script_input = QLineEdit(self.app_data.get('script_path', ''))
+        self.script_input = QLineEdit(self.app_data.script_path)
         self.script_btn = QPushButton("Browse...")
         self.script_btn.clicked.connect(lambda: self.browse_file(self.script_input))
         self.script_row = QHBoxLayout()
@@ -419,7 +1469,7 @@ class AppEditorDialog(QDialog):
         self.script_container.setLayout(self.script_row)
         path_layout.addRow("Script/Exec:", self.script_container)
 
-        self.python_input = QLineEdit(self.app_data.get('python_path', sys.executable))
+        self.python_input = QLineEdit(self.app_data.python_path or sys.executable)
         self.python_btn = QPushButton("Browse...")
         self.python_btn.clicked.connect(lambda: self.browse_file(self.python_input))
         self.python_row = QHBoxLayout()
@@ -429,6 +1479,12 @@ class AppEditorDialog(QDialog):
         self.python_container.setLayout(self.python_row)
         path_layout.addRow("Python Path:", self.python_container)
 
+        self.launch_combo = QComboBox()
+        self.launch_combo.addItems(["Default", *LAUNCH_MODES])
+        self.launch_combo.setCurrentText(self.app_data.launch_mode or "Default")
+        self.launch_combo.setToolTip("Default: the Launching setting; auto starts installed apps without a terminal")
+        path_layout.addRow("Launch In:", self.launch_combo)
+
         self.import_sys_btn = QPushButton("Import from System/Flatpak...")
         self.import_sys_btn.clicked.connect(self.import_system_app)
         path_layout.addRow("", self.import_sys_btn)
@@ -437,19 +1493,20 @@ class AppEditorDialog(QDialog):
 
         # 4. Toggles
         self.full_tile_check = QCheckBox("Full Tile Mode (Image fills tile)")
-        self.full_tile_check.setChecked(self.app_data.get('full_tile', False))
+        self.full_tile_check.setChecked(self.app_data.full_tile)
         layout.addRow("", self.full_tile_check)
         
-        self.wide_tile_check = QCheckBox("Wide Tile Mode (2x1)")
-        self.wide_tile_check.setChecked(self.app_data.get('wide_tile', False))
-        layout.addRow("", self.wide_tile_check)
+        self.span_combo = QComboBox()
+        self.span_combo.addItems(list(TILE_SPANS))
+        self.span_combo.setCurrentText(self.app_data.tile_span)
+        layout.addRow("Tile Size:", self.span_combo)
 
         # 5. Color
         self.color_btn = QPushButton("Pick Color")
         default_color = '#00a300'
         if self.parent_window:
-             default_color = self.parent_window.config['settings'].get('default_tile_color', '#00a300')
-        self.selected_color = self.app_data.get('color', default_color)
+             default_color = self.parent_window.config.settings.default_tile_color
+        self.selected_color = self.app_data.color or default_color
         self.color_btn.setStyleSheet(f"background-color: {self.selected_color}")
         self.color_btn.clicked.connect(self.pick_color)
         layout.addRow("Tile Color:", self.color_btn)
@@ -465,7 +1522,7 @@ class AppEditorDialog(QDialog):
         layout.addRow(btn_box)
         
         # Initialize State
-        current_type = self.app_data.get('type', 'app')
+        current_type = self.app_data.type
         if current_type == 'desktop':
             self.mode_combo.setCurrentText("Special Tile")
             self.special_combo.setCurrentText("Show Desktop")
@@ -500,7 +1557,8 @@ class AppEditorDialog(QDialog):
                 self.color_btn.setStyleSheet(f"background-color: {self.selected_color}")
 
     def import_system_app(self):
-        dlg = AppImporterDialog(self)
+        catalog = self.parent_window.app_catalog if self.parent_window else None
+        dlg = AppImporterDialog(self, catalog)
         if dlg.exec():
             app = dlg.get_selected_app()
             if app:
@@ -508,10 +1566,10 @@ class AppEditorDialog(QDialog):
                 self.script_input.setText(app['exec'])
                 self.python_input.setText("SYSTEM") 
                 if dlg.icon_check.isChecked() and app['icon_name']:
-                    self.app_data['icon'] = app['icon_name']
+                    self.icon = app['icon_name']
 
-    def get_data(self):
-        # Determine internal 'type' based on UI selection
+    def get_data(self, tile=None):
+        # Fill in tile (a new Tile by default) from the form
         mode = self.mode_combo.currentText()
         internal_type = 'app'
         
@@ -521,26 +1579,25 @@ class AppEditorDialog(QDialog):
                 internal_type = 'desktop'
             # Add elif for future functions here
         
-        data = {
-            "name": self.name_input.text(),
-            "type": internal_type,
-            "color": self.selected_color,
-            "icon": self.app_data.get('icon', None),
-            "full_tile": self.full_tile_check.isChecked(),
-            "wide_tile": self.wide_tile_check.isChecked()
-        }
+        tile = tile or Tile()
+        tile.name = self.name_input.text()
+        tile.type = internal_type
+        tile.color = self.selected_color
+        tile.icon = self.icon
+        tile.full_tile = self.full_tile_check.isChecked()
+        tile.tile_span = self.span_combo.currentText()
         
         if internal_type == 'app':
-            data['script_path'] = self.script_input.text()
-            data['python_path'] = self.python_input.text()
+            tile.script_path = self.script_input.text()
+            tile.python_path = self.python_input.text()
+            mode = self.launch_combo.currentText()
+            tile.launch_mode = None if mode == "Default" else mode
         else:
-            # Special tiles usually don't need paths, but keep keys to avoid errors
-            data['script_path'] = ""
-            data['python_path'] = ""
-            
-        # Ensure apps list exists for structure consistency (though specific to folders previously)
-        data['apps'] = self.app_data.get('apps', [])
-        return data
+            # Special tiles don't run anything
+            tile.script_path = ""
+            tile.python_path = ""
+            tile.launch_mode = None
+        return tile
 # --- HELPER: Settings & Themes Dialog ---
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
@@ -559,17 +1616,17 @@ class SettingsDialog(QDialog):
         
         self.bg_type = QComboBox()
         self.bg_type.addItems(["color", "image"])
-        self.bg_type.setCurrentText(parent.config['settings'].get('background_type', 'color'))
+        self.bg_type.setCurrentText(parent.config.settings.background_type)
         form.addRow("Background Type:", self.bg_type)
         
-        self.bg_value = QLineEdit(parent.config['settings'].get('background_value', ''))
+        self.bg_value = QLineEdit(parent.config.settings.background_value)
         browse_bg = QPushButton("Browse Image")
         browse_bg.clicked.connect(self.browse_bg)
         form.addRow("Image Path:", self.bg_value)
         form.addRow("", browse_bg)
 
         self.bg_color_btn = QPushButton("Pick Background Color")
-        self.current_bg_color = parent.config['settings'].get('background_color', '#1d1d1d')
+        self.current_bg_color = parent.config.settings.background_color
         self.bg_color_btn.setStyleSheet(f"background-color: {self.current_bg_color}")
         self.bg_color_btn.clicked.connect(lambda: self.pick_color('bg'))
         form.addRow("Background Color:", self.bg_color_btn)
@@ -577,14 +1634,14 @@ class SettingsDialog(QDialog):
         form.addRow(QLabel("<b>Tile Settings</b>"))
 
         self.def_tile_btn = QPushButton("Pick Default Tile Color")
-        self.current_tile_color = parent.config['settings'].get('default_tile_color', '#00a300')
+        self.current_tile_color = parent.config.settings.default_tile_color
         self.def_tile_btn.setStyleSheet(f"background-color: {self.current_tile_color}")
         self.def_tile_btn.clicked.connect(lambda: self.pick_color('tile'))
         form.addRow("Default App Color:", self.def_tile_btn)
 
         self.size_slider = QSlider(Qt.Orientation.Horizontal)
         self.size_slider.setRange(80, 240)
-        self.size_slider.setValue(parent.config['settings'].get('tile_size', 140))
+        self.size_slider.setValue(parent.config.settings.tile_size)
         self.size_lbl = QLabel(f"{self.size_slider.value()} px")
         self.size_slider.valueChanged.connect(lambda v: self.size_lbl.setText(f"{v} px"))
         form.addRow("Tile Size:", self.size_lbl)
@@ -592,32 +1649,59 @@ class SettingsDialog(QDialog):
         
         self.col_spin = QSpinBox()
         self.col_spin.setRange(1, 10)
-        self.col_spin.setValue(parent.config['settings'].get('group_columns', 2))
+        self.col_spin.setValue(parent.config.settings.group_columns)
         form.addRow("Columns per Group:", self.col_spin)
         
+        self.render_mode = QComboBox()
+        self.render_mode.addItems(["widgets", "canvas"])
+        self.render_mode.setCurrentText(parent.config.settings.render_mode)
+        self.render_mode.setToolTip("canvas paints each group's tiles in one pass (lighter for large layouts)")
+        form.addRow("Tile Rendering:", self.render_mode)
+        
+        self.icon_cache_spin = QSpinBox()
+        self.icon_cache_spin.setRange(8, 1024)
+        self.icon_cache_spin.setSuffix(" MB")
+        self.icon_cache_spin.setValue(parent.config.settings.icon_cache_mb)
+        form.addRow("Icon Cache Budget:", self.icon_cache_spin)
+        
+        self.reduced_motion = QCheckBox("Reduce motion (no tile zoom animations)")
+        self.reduced_motion.setChecked(parent.config.settings.reduced_motion)
+        form.addRow(self.reduced_motion)
+        
+        self.storage_combo = QComboBox()
+        self.storage_combo.addItems(["json", "sqlite"])
+        self.storage_combo.setCurrentText(parent.config.settings.storage)
+        self.storage_combo.setToolTip("sqlite saves single tile edits as one-row updates (config.db)")
+        form.addRow("Config Storage:", self.storage_combo)
+        
+        self.global_hotkey = QCheckBox("Global hotkey Super+P (needs pynput)")
+        self.global_hotkey.setChecked(parent.config.settings.global_hotkey)
+        self.global_hotkey.setToolTip("Without it, bind a key to `Lumex8.py toggle` in your window manager")
+        form.addRow(self.global_hotkey)
+        
         tabs.addTab(appear_tab, "Appearance")
 
         # TAB 2: Start Button
         sb_tab = QWidget()
         sb_form = QFormLayout(sb_tab)
-        sb_config = parent.config.get('start_btn', {})
+        sb_config = parent.config.start_btn
 
         self.sb_visible = QCheckBox("Show Floating Start Button")
-        self.sb_visible.setChecked(sb_config.get('visible', True))
+        self.sb_visible.setChecked(sb_config.visible)
         sb_form.addRow(self.sb_visible)
         
         self.sb_autohide = QCheckBox("Invisible until hovered (Auto-Hide)")
-        self.sb_autohide.setChecked(sb_config.get('autohide', False))
+        self.sb_autohide.setChecked(sb_config.autohide)
         sb_form.addRow(self.sb_autohide)
 
         self.sb_pos = QComboBox()
         self.sb_pos.addItems(["Bottom Left", "Bottom Center", "Bottom Right", "Top Left", "Top Center", "Top Right"])
-        self.sb_pos.setCurrentText(sb_config.get('position', 'Bottom Left'))
+        self.sb_pos.setCurrentText(sb_config.position)
         sb_form.addRow("Position:", self.sb_pos)
 
         self.sb_size = QSlider(Qt.Orientation.Horizontal)
         self.sb_size.setRange(30, 100)
-        self.sb_size.setValue(sb_config.get('size', 60))
+        self.sb_size.setValue(sb_config.size)
         self.sb_size_lbl = QLabel(f"{self.sb_size.value()} px")
         self.sb_size.valueChanged.connect(lambda v: self.sb_size_lbl.setText(f"{v} px"))
         sb_form.addRow("Height:", self.sb_size_lbl)
@@ -625,24 +1709,46 @@ class SettingsDialog(QDialog):
 
         self.sb_icon_type = QComboBox()
         self.sb_icon_type.addItems(["text", "image"])
-        self.sb_icon_type.setCurrentText(sb_config.get('icon_type', 'text'))
+        self.sb_icon_type.setCurrentText(sb_config.icon_type)
         sb_form.addRow("Icon Type:", self.sb_icon_type)
 
-        self.sb_icon_val = QLineEdit(sb_config.get('icon_val', '❖'))
+        self.sb_icon_val = QLineEdit(sb_config.icon_val)
         sb_browse = QPushButton("Browse Icon")
         sb_browse.clicked.connect(self.browse_sb_icon)
         sb_form.addRow("Icon/Text:", self.sb_icon_val)
         sb_form.addRow("", sb_browse)
 
         self.sb_color_btn = QPushButton("Pick Button Color")
-        self.current_sb_color = sb_config.get('color', 'rgba(255, 255, 255, 0.2)')
+        self.current_sb_color = sb_config.color
         self.sb_color_btn.setStyleSheet(f"background-color: {self.current_sb_color}")
         self.sb_color_btn.clicked.connect(lambda: self.pick_color('sb'))
         sb_form.addRow("Color:", self.sb_color_btn)
 
         tabs.addTab(sb_tab, "Start Button")
 
-        # TAB 3: Themes
+        # TAB 3: Launching
+        launch_tab = QWidget()
+        launch_layout = QVBoxLayout(launch_tab)
+        launch_form = QFormLayout()
+        self.launch_mode = QComboBox()
+        self.launch_mode.addItems(LAUNCH_MODES)
+        self.launch_mode.setCurrentText(parent.config.settings.launch_mode)
+        self.launch_mode.setToolTip(f"auto: {default_terminal()} (detected); headless and direct run without a "
+                                    "terminal and log the output, direct also without a shell")
+        launch_form.addRow("Run Scripts In:", self.launch_mode)
+        latency = parent.supervisor.latency_summary()
+        launch_form.addRow("Median Launch Latency:", QLabel(latency or "no launches yet"))
+        launch_layout.addLayout(launch_form)
+        launch_layout.addWidget(QLabel("Fast start interpreters, one per line as <i>python: module, module</i>.<br>"
+                                       "Their script tiles run forked from a warm interpreter with those modules<br>"
+                                       "already imported, without a terminal (output goes to a log), unless the tile<br>"
+                                       "sets its own Launch In backend."))
+        self.fast_start_edit = QPlainTextEdit(format_fast_start(parent.config.settings.fast_start))
+        self.fast_start_edit.setPlaceholderText(f"{sys.executable}: json, requests")
+        launch_layout.addWidget(self.fast_start_edit)
+        tabs.addTab(launch_tab, "Launching")
+
+        # TAB 4: Themes
         theme_tab = QWidget()
         theme_layout = QVBoxLayout(theme_tab)
         theme_layout.addWidget(QLabel("Recent Themes:"))
@@ -666,7 +1772,7 @@ class SettingsDialog(QDialog):
         layout.addWidget(save_btn)
 
     def populate_recent(self):
-        recents = self.parent_window.config.get('recent_themes', [])
+        recents = self.parent_window.config.recent_themes
         for theme in recents:
             self.recent_list.addItem(theme['name'])
 
@@ -715,31 +1821,39 @@ class SettingsDialog(QDialog):
                     self.sb_color_btn.setStyleSheet(f"background-color: {name}")
 
     def get_current_settings(self):
-        return {
-            "window_title": "Pop Metro Launcher",
-            "background_type": self.bg_type.currentText(),
-            "background_value": self.bg_value.text(),
-            "background_color": self.current_bg_color,
-            "default_tile_color": self.current_tile_color,
-            "tile_size": self.size_slider.value(),
-            "group_columns": self.col_spin.value()
-        }
+        return replace(self.parent_window.config.settings,
+            background_type=self.bg_type.currentText(),
+            background_value=self.bg_value.text(),
+            background_color=self.current_bg_color,
+            default_tile_color=self.current_tile_color,
+            tile_size=self.size_slider.value(),
+            group_columns=self.col_spin.value(),
+            render_mode=self.render_mode.currentText(),
+            icon_cache_mb=self.icon_cache_spin.value(),
+            reduced_motion=self.reduced_motion.isChecked(),
+            storage=self.storage_combo.currentText(),
+            global_hotkey=self.global_hotkey.isChecked(),
+            launch_mode=self.launch_mode.currentText(),
+            fast_start=parse_fast_start(self.fast_start_edit.toPlainText())
+        )
 
     def get_sb_settings(self):
-        return {
-            "visible": self.sb_visible.isChecked(),
-            "autohide": self.sb_autohide.isChecked(),
-            "position": self.sb_pos.currentText(),
-            "size": self.sb_size.value(),
-            "icon_type": self.sb_icon_type.currentText(),
-            "icon_val": self.sb_icon_val.text(),
-            "color": self.current_sb_color
-        }
+        return replace(self.parent_window.config.start_btn,
+            visible=self.sb_visible.isChecked(),
+            autohide=self.sb_autohide.isChecked(),
+            position=self.sb_pos.currentText(),
+            size=self.sb_size.value(),
+            icon_type=self.sb_icon_type.currentText(),
+            icon_val=self.sb_icon_val.text(),
+            color=self.current_sb_color
+        )
 
     def save_and_close(self):
-        self.parent_window.config['settings'] = self.get_current_settings()
-        self.parent_window.config['start_btn'] = self.get_sb_settings()
+        self.parent_window.config.settings = self.get_current_settings()
+        self.parent_window.config.start_btn = self.get_sb_settings()
+        self.parent_window.set_storage(self.storage_combo.currentText())
         self.parent_window.save_config()
+        self.parent_window.apply_runtime_settings()
         self.parent_window.apply_background()
         self.parent_window.refresh_ui()
         self.parent_window.floating_btn.apply_settings()
@@ -755,8 +1869,8 @@ class SettingsDialog(QDialog):
             fname = dlg.selectedFiles()[0]
             theme_data = {
                 "name": os.path.basename(fname),
-                "settings": self.get_current_settings(),
-                "start_btn": self.get_sb_settings()
+                "settings": self.get_current_settings().theme_dict(),
+                "start_btn": self.get_sb_settings().to_dict()
             }
             with open(fname, 'w') as f:
                 json.dump(theme_data, f)
@@ -771,16 +1885,8 @@ class SettingsDialog(QDialog):
             try:
                 with open(fname, 'r') as f:
                     data = json.load(f)
-                    if 'settings' in data:
-                        self.parent_window.config['settings'] = data['settings']
-                    if 'start_btn' in data:
-                        self.parent_window.config['start_btn'] = data['start_btn']
-                    
+                    self.parent_window.apply_theme(data)
                     self.parent_window.add_recent_theme(data.get('name','Theme'), data)
-                    self.parent_window.save_config()
-                    self.parent_window.apply_background()
-                    self.parent_window.refresh_ui()
-                    self.parent_window.floating_btn.apply_settings()
                     self.close()
             except Exception as e:
                 self.show_message("Error", str(e))
@@ -794,179 +1900,435 @@ class SettingsDialog(QDialog):
 
     def load_recent_theme(self, item):
         name = item.text()
-        recents = self.parent_window.config.get('recent_themes', [])
+        recents = self.parent_window.config.recent_themes
         for theme in recents:
             if theme['name'] == name:
                 if 'settings' in theme['settings']:
-                     self.parent_window.config['settings'] = theme['settings']['settings']
-                     self.parent_window.config['start_btn'] = theme['settings'].get('start_btn', {})
+                     self.parent_window.apply_theme(theme['settings'])
                 else:
-                     self.parent_window.config['settings'] = theme['settings']
-                
-                self.parent_window.save_config()
-                self.parent_window.apply_background()
-                self.parent_window.refresh_ui()
-                self.parent_window.floating_btn.apply_settings()
+                     self.parent_window.apply_theme({"settings": theme['settings']})
                 self.close()
                 break
 
-# --- CORE: Animated Tile Widget ---
-class MetroTile(QPushButton):
-    def __init__(self, app_data, parent_window, group_index, item_index, is_add=False, is_back=False):
-        super().__init__()
-        self.app_data = app_data
-        self.parent_window = parent_window
-        self.group_index = group_index 
-        self.item_index = item_index
-        self.is_add = is_add
-        self.is_back = is_back
-        
-        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.setAcceptDrops(True)
-        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        
-        self.drag_start_position = None
-        self.drop_target_mode = None
-        self._last_drag_target_mode = None 
-        self.insert_side = 'left' 
+# --- CORE: Tile Rendering Helpers ---
+TILE_MIME = "application/x-lumex8-tile"
 
-        self._scale = 1.0
-        self.anim = QPropertyAnimation(self, b"scale_prop")
-        self.anim.setDuration(100) 
-        self.anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+def tile_span(app_data, settings):
+    # (columns, rows) this tile covers in its group
+    return fit_span(TILE_SPANS.get(app_data.tile_span, (1, 1)), settings.group_columns)
 
-        self.init_widgets()
-        self.update_fixed_size() 
-        self.update_style()
+def span_size(span, size, spacing=4):
+    w, h = span
+    return (size * w) + spacing * (w - 1), (size * h) + spacing * (h - 1)
 
-    def update_fixed_size(self):
-        size = self.parent_window.config['settings'].get('tile_size', 140)
-        spacing = 4 
-        
-        is_wide = self.app_data.get('wide_tile', False)
-        
-        cols = self.parent_window.config['settings'].get('group_columns', 2)
-        if cols < 2: is_wide = False
+def tile_pixmap(app_data, settings, on_ready=None, dpr=1.0):
+    # Final pixmap shown on a tile (custom image or theme icon), or None for initials.
+    # With on_ready, image files are decoded in the background: None is returned for now
+    # and on_ready(pixmap_or_None) follows once the image is ready.
+    icon_path = app_data.icon
+    if not icon_path: return None
+    
+    size = settings.tile_size
+    is_full = app_data.full_tile
+    span = tile_span(app_data, settings)
+    target_w, target_h = span_size(span, size)
+    
+    if not is_full:
+        target_w = int(size * 0.5 * min(span))
+        target_h = target_w
+
+    if '/' in icon_path or os.path.exists(icon_path):
+        # Image file (possibly relative, like 'icon.png'); theme icon names never contain a slash
+        return get_cached_pixmap(icon_path, target_w, target_h, on_ready,
+                                 'cover' if is_full else 'fit', dpr)
+    theme_path = icon_theme_index().lookup(icon_path, round(max(target_w, target_h) * dpr))
+    if theme_path:
+        return get_cached_pixmap(theme_path, target_w, target_h, on_ready, 'fit', dpr)
+    return None
 
-        width = size
-        height = size
+def tile_drag_source(mime_data):
+    # (group_index, item_index) of a dragged tile, or None if this is not a tile drag
+    if not mime_data.hasFormat(TILE_MIME): return None
+    group_index, item_index = bytes(mime_data.data(TILE_MIME)).decode().split("|")
+    return int(group_index), int(item_index)
+
+def tile_mime_data(group_index, item_index):
+    mime_data = QMimeData()
+    mime_data.setData(TILE_MIME, f"{group_index}|{item_index}".encode())
+    return mime_data
+
+TILE_FONTS = {}
+
+def tile_fonts(size):
+    # (text, initials, delete) fonts shared by every tile of this size
+    fonts = TILE_FONTS.get(size)
+    if fonts is None:
+        text_font = QFont()
+        text_font.setPixelSize(max(10, int(size*0.09)))
+        text_font.setWeight(QFont.Weight.Medium)
+        initials_font = QFont()
+        initials_font.setPixelSize(int(size*0.3))
+        initials_font.setBold(True)
+        delete_font = QFont()
+        delete_font.setPixelSize(16)
+        delete_font.setBold(True)
+        fonts = TILE_FONTS[size] = (text_font, initials_font, delete_font)
+    return fonts
+
+def paint_tile_face(painter, r, app_data, pixmap, is_add, fonts):
+    # Icon (or initials) and name of a tile; shared by MetroTile and the canvas renderer
+    text_font, initials_font, _ = fonts
+    w = r.width()
+    h = r.height()
+    if is_add:
+        painter.setPen(QColor("#888"))
+        painter.setFont(initials_font)
+        painter.drawText(r, Qt.AlignmentFlag.AlignCenter, "➕")
+        return
+    is_full = app_data.full_tile
+    icon_rect = QRect(r) if is_full else QRect(r.x(), r.y(), w, h - int(h * 0.30))
+    if pixmap:
+        size = pixmap.deviceIndependentSize().toSize()
+        painter.drawPixmap(icon_rect.x() + (icon_rect.width() - size.width()) // 2,
+                           icon_rect.y() + (icon_rect.height() - size.height()) // 2, pixmap)
+    else:
+        painter.setPen(Qt.GlobalColor.white)
+        painter.setFont(initials_font)
+        painter.drawText(icon_rect, Qt.AlignmentFlag.AlignCenter, (app_data.name or '??')[:2].upper())
+    if not is_full:
+        painter.setPen(Qt.GlobalColor.white)
+        painter.setFont(text_font)
+        text_rect = QRect(r.x() + 7, icon_rect.bottom() + 3, w - 14, h - icon_rect.height() - 4)
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignLeft | Qt.TextFlag.TextWordWrap,
+                         app_data.name or 'Unknown')
+
+def paint_hover_border(painter, rect):
+    painter.setPen(QPen(QColor(255, 255, 255, 128), 3))
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    painter.drawRect(QRectF(rect).adjusted(1.5, 1.5, -1.5, -1.5))
+
+def paint_delete_badge(painter, rect, font):
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor("red"))
+    painter.drawRect(rect)
+    painter.setPen(Qt.GlobalColor.white)
+    painter.setFont(font)
+    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "×")
+
+def paint_run_state(painter, r, state):
+    # Dot in the bottom-right corner: white while the tile's program runs, red if its last launch failed
+    if state is None: return
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(255, 255, 255) if state == 'running' else QColor(229, 20, 0))
+    painter.drawEllipse(QRectF(r.right() - 13, r.bottom() - 13, 8, 8))
+
+# Terminal backends: argv prefix that runs the command after it in a new terminal window.
+# Besides these, 'headless' runs the script (or an installed app's command) through bash
+# without a terminal and 'direct' execs the interpreter itself; both append the output to
+# the run log (see run_log_path). 'direct' installed apps keep Lumex8's stdout.
+TERMINALS = {
+    'gnome-terminal': ['gnome-terminal', '--'],
+    'konsole': ['konsole', '-e'],
+    'kitty': ['kitty'],
+    'alacritty': ['alacritty', '-e'],
+    'foot': ['foot'],
+    'xterm': ['xterm', '-e'],
+}
+LAUNCH_MODES = ('auto', *TERMINALS, 'headless', 'direct')
+_TERMINAL = None
+
+def default_terminal():
+    # $TERMINAL if it is one we know, else the first installed one; looked up once per run
+    global _TERMINAL
+    if _TERMINAL is None:
+        preferred = os.path.basename(os.environ.get('TERMINAL', ''))
+        names = ([preferred] if preferred in TERMINALS else []) + list(TERMINALS)
+        _TERMINAL = next((name for name in names if shutil.which(TERMINALS[name][0])), 'headless')
+        log.info("terminal backend: %s", _TERMINAL)
+    return _TERMINAL
+
+def launch_mode(app_data, default='auto'):
+    # Effective backend for a tile: its own choice, else the global one, with 'auto' resolved
+    mode = app_data.launch_mode or default
+    if mode not in LAUNCH_MODES: mode = 'auto'
+    if mode == 'auto':
+        # Installed applications start without a terminal unless the tile asks for one
+        if app_data.python_path == "SYSTEM": return 'direct'
+        return default_terminal()
+    return mode
+
+def tile_command(app_data, mode):
+    # (argv, cwd, path that must exist, log for the output or None) to run a tile with a
+    # backend from launch_mode(); no I/O, so safe on the GUI thread
+    script = app_data.script_path
+    python_exe = app_data.python_path
+    
+    if python_exe == "SYSTEM":
+        argv = script.split()
+        if not argv: raise ValueError("No command set")
+        if mode in TERMINALS: return TERMINALS[mode] + argv, None, None, None
+        if mode == 'headless': return ['bash', '-c', shlex.join(argv)], None, None, run_log_path(script)
+        return argv, None, None, None
         
-        if is_wide:
-            width = (size * 2) + spacing
-            
-        self.setFixedSize(width, height)
+    if not script: raise ValueError("No script set")
+    cwd = os.path.dirname(script)
+    line = shlex.join([python_exe, script])
+    if mode == 'direct': return [python_exe, script], cwd, script, run_log_path(script)
+    if mode == 'headless': return ['bash', '-c', line], cwd, script, run_log_path(script)
+    return TERMINALS[mode] + ['bash', '-c', line + '; exec bash'], cwd, script, None
+
+class TileActions:
+    # Tile behaviour shared by MetroTile and the canvas renderer's TileRecord.
+    # Users provide app_data, parent_window, group_index, item_index, is_add,
+    # dialog_parent() and refresh_tile().
+    __slots__ = ()
 
-    def get_scale_prop(self): return self._scale
-    def set_scale_prop(self, val):
-        self._scale = val
-        self.update() 
-    scale_prop = pyqtProperty(float, get_scale_prop, set_scale_prop)
+    def trigger_action(self):
+        if self.is_add: self.parent_window.add_new_item(self.group_index)
+        elif not self.parent_window.is_edit_mode:
+            if self.app_data.type == 'desktop':
+                self.parent_window.toggle_visibility() 
+            else:
+                self.launch_app()
 
-    def init_widgets(self):
-        self.icon_label = QLabel(self)
-        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+    def launch_app(self):
+        # Spawning happens in the background; failures show on the tile and in a tray message
+        self.parent_window.supervisor.launch(self.app_data)
+        self.parent_window.toggle_visibility()
+
+    def request_delete(self):
+        self.parent_window.delete_item(self.group_index, self.item_index)
+
+    def exec_context_menu(self, global_pos):
+        if self.is_add: return
+        menu = QMenu(self.dialog_parent())
+        menu.setWindowFlags(menu.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
         
-        self.text_label = QLabel(self)
-        self.text_label.setAlignment(Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignLeft)
-        self.text_label.setWordWrap(True)
-        self.text_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        tile_menu = menu.addMenu("Tile")
+        tile_menu.addAction("Change Color", self.change_color)
+        tile_menu.addAction("Change Icon", self.change_icon)
+        tile_menu.addAction("Remove Icon", self.remove_icon)
         
-        self.delete_btn = QPushButton("×", self)
-        self.delete_btn.setStyleSheet("background-color: red; color: white; border: none; font-weight: bold; font-size: 16px;")
-        self.delete_btn.clicked.connect(self.request_delete)
-        self.delete_btn.hide()
+        menu.addAction("Properties", self.edit_details)
+        last = self.parent_window.supervisor.last_run(self.app_data)
+        if last is not None:
+            menu.addAction(f"Last run: {last.describe()}").setEnabled(False)
+        output = self.parent_window.supervisor.output_log(self.app_data)
+        if output is not None:
+            menu.addAction("Open Output Log", lambda: QDesktopServices.openUrl(QUrl.fromLocalFile(output)))
+        menu.addSeparator()
+        menu.addAction("Delete", self.request_delete)
         
-        self.update_content()
+        menu.exec(global_pos)
 
-    def update_content(self):
-        if self.is_add:
-            self.icon_label.setText("➕")
-            self.text_label.setText("")
-        elif self.is_back:
-            # Not used anymore as folders are removed, but kept for safe cleanup
+    def change_name(self):
+        dlg = QInputDialog(self.dialog_parent())
+        dlg.setWindowFlags(dlg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
+        dlg.setWindowTitle("Rename")
+        dlg.setLabelText("Name:")
+        dlg.setTextValue(self.app_data.name)
+        if dlg.exec():
+            new_name = dlg.textValue()
+            if new_name:
+                self.app_data.name = new_name
+                self.refresh_tile()
+                self.parent_window.save_tile(self.app_data)
+
+    def change_icon(self):
+        dlg = QFileDialog(self.dialog_parent(), "Select Icon")
+        dlg.setNameFilter("Images (*.png *.jpg *.svg)")
+        dlg.setWindowFlags(dlg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
+        if dlg.exec():
+            files = dlg.selectedFiles()
+            if files:
+                self.app_data.icon = files[0]
+                self.refresh_tile()
+                self.parent_window.save_tile(self.app_data)
+
+    def remove_icon(self):
+        self.app_data.icon = None
+        self.refresh_tile()
+        self.parent_window.save_tile(self.app_data)
+
+    def change_color(self):
+        initial = QColor(self.app_data.color or '#000')
+        dlg = QColorDialog(initial, self.dialog_parent())
+        dlg.setWindowFlags(dlg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
+        if dlg.exec():
+            color = dlg.selectedColor()
+            if color.isValid():
+                self.app_data.color = color.name()
+                self.refresh_tile()
+                self.parent_window.save_tile(self.app_data)
+
+    def edit_details(self):
+        dlg = AppEditorDialog(self.dialog_parent(), self.parent_window, self.app_data)
+        if dlg.exec():
+            dlg.get_data(self.app_data)
+            self.parent_window.refresh_ui()
+            self.parent_window.save_tile(self.app_data)
+
+# --- TILE ANIMATION ---
+class TileAnimator(QObject):
+    # One clock for every tile scale animation (hover, press, release). Each tick advances
+    # all active animations and the targets repaint only their own rect; Qt merges those
+    # into one paint per frame. The timer runs at the screen refresh rate and stops when idle.
+    DURATION = 0.1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.reduced_motion = False
+        self.active = {} # target -> [start_value, end_value, start_time, apply]
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+
+    def frame_interval(self):
+        screen = QApplication.primaryScreen()
+        rate = screen.refreshRate() if screen else 0
+        return max(4, round(1000 / (rate if rate > 1 else 60)))
+
+    def animate(self, target, start, end, apply):
+        # apply(value) stores the scale on target and schedules its repaint
+        if self.reduced_motion or start == end:
+            self.active.pop(target, None)
+            apply(end)
+            return
+        self.active[target] = [start, end, time.monotonic(), apply]
+        if not self.timer.isActive():
+            self.timer.start(self.frame_interval())
+
+    def stop(self, target):
+        self.active.pop(target, None)
+
+    def tick(self):
+        now = time.monotonic()
+        for target, (start, end, started, apply) in list(self.active.items()):
+            t = min(1.0, (now - started) / self.DURATION)
+            eased = 1 - (1 - t) * (1 - t) # OutQuad
+            try: apply(start + (end - start) * eased)
+            except RuntimeError: t = 1.0 # Widget was deleted mid-animation
+            if t >= 1.0: self.active.pop(target, None)
+        if not self.active: self.timer.stop()
+
+# --- CORE: Animated Tile Widget ---
+class MetroTile(QPushButton, TileActions):
+    def __init__(self, app_data, parent_window, group_index, item_index, is_add=False, is_back=False):
+        super().__init__()
+        self.app_data = app_data
+        self.parent_window = parent_window
+        self.group_index = group_index 
+        self.item_index = item_index
+        self.is_add = is_add
+        self.is_back = is_back
+        
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setAcceptDrops(True)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        
+        self.drag_start_position = None
+        self.drop_target_mode = None
+        self.hovered = False
+        self.insert_side = 'left' 
+
+        self._scale = 1.0
+        self._icon_token = None
+
+        self.init_widgets()
+        self.update_fixed_size() 
+        self._synced_state = self.sync_state()
+
+    def sync_state(self):
+        # Everything that affects how this tile looks; compared on refresh_ui to skip unchanged tiles
+        settings = self.parent_window.config.settings
+        return (self.app_data.astuple(), settings.tile_size, settings.group_columns,
+                settings.default_tile_color, self.devicePixelRatioF())
+
+    def sync(self, group_index, item_index):
+        self.group_index = group_index
+        self.item_index = item_index
+        state = self.sync_state()
+        if state != self._synced_state:
+            self._synced_state = state
+            self.update_fixed_size()
+            self.update_content()
+            self.layout_children()
+            self.update()
+        self.delete_btn.setVisible(self.parent_window.is_edit_mode and not self.is_add)
+
+    def rebind(self, app_data, group_index, item_index):
+        # Reuse this widget for another app (see TilePool)
+        self.app_data = app_data
+        self.parent_window.animator.stop(self)
+        self._scale = 1.0
+        self.drag_start_position = None
+        self.drop_target_mode = None
+        self.hovered = False
+        self.setDown(False)
+        self._synced_state = None
+        self.sync(group_index, item_index)
+
+    def reset_for_pool(self):
+        self.parent_window.animator.stop(self)
+        self._scale = 1.0
+        self.hovered = False
+        self.clearFocus()
+        self.setAttribute(Qt.WidgetAttribute.WA_UnderMouse, False)
+        self.hide()
+
+    def update_fixed_size(self):
+        settings = self.parent_window.config.settings
+        self.setFixedSize(*span_size(tile_span(self.app_data, settings), settings.tile_size))
+
+    def set_scale(self, val):
+        self._scale = val
+        self.update() 
+
+    def animate_scale(self, end):
+        self.parent_window.animator.animate(self, self._scale, end, self.set_scale)
+
+    def init_widgets(self):
+        # Icon, initials and name are painted in paintEvent; only the delete badge is a child widget
+        self.pixmap = None
+        self.delete_btn = TileDeleteButton(self)
+        self.delete_btn.setFont(tile_fonts(self.parent_window.config.settings.tile_size)[2])
+        self.delete_btn.clicked.connect(self.request_delete)
+        self.delete_btn.hide()
+        
+        self.update_content()
+
+    def update_content(self):
+        if self.is_add:
+            self.pixmap = None
+        elif self.is_back:
+            # Not used anymore as folders are removed, but kept for safe cleanup
             pass
         else:
-            name_text = self.app_data.get('name', 'Unknown')
-            self.text_label.setText(name_text)
             self.update_icon_display()
 
     def update_icon_display(self):
-        icon_path = self.app_data.get('icon')
-        name = self.app_data.get('name', '??')
-        
-        size = self.parent_window.config['settings'].get('tile_size', 140)
-        is_full = self.app_data.get('full_tile', False)
-        
-        spacing = 4
-        is_wide = self.app_data.get('wide_tile', False)
-        cols = self.parent_window.config['settings'].get('group_columns', 2)
-        if cols < 2: is_wide = False
-        
-        target_w = (size * 2) + spacing if is_wide else size
-        target_h = size
-        
-        if not is_full:
-            target_w = int(size * 0.5)
-            target_h = int(size * 0.5)
-
-        cached_pix = None
-        if icon_path:
-            cached_pix = get_cached_pixmap(icon_path, target_w, target_h)
-        
-        if cached_pix:
-            if is_full:
-                scaled = cached_pix.scaled(target_w, target_h, Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
-                x = (scaled.width() - target_w) // 2
-                y = (scaled.height() - target_h) // 2
-                final_pix = scaled.copy(x, y, target_w, target_h)
-                self.icon_label.setPixmap(final_pix)
-            else:
-                self.icon_label.setPixmap(cached_pix)
-            self.icon_label.setText("") 
-        elif icon_path and QIcon.hasThemeIcon(icon_path):
-            icon = QIcon.fromTheme(icon_path)
-            pixmap = icon.pixmap(target_w, target_h)
-            self.icon_label.setPixmap(pixmap)
-            self.icon_label.setText("")
-        else:
-            self.icon_label.setPixmap(QPixmap())
-            initials = name[:2].upper()
-            self.icon_label.setText(initials)
-            
-        if self.is_add:
-            self.icon_label.setStyleSheet(f"font-size: {int(size*0.3)}px; color: #888; background: transparent;")
-        else:
-            if not self.icon_label.pixmap().isNull():
-                 self.icon_label.setStyleSheet("background: transparent;")
-            else:
-                 self.icon_label.setStyleSheet(f"font-size: {int(size*0.3)}px; font-weight: bold; color: white; background: transparent;")
-            
-            self.text_label.setStyleSheet(f"font-size: {max(10, int(size*0.09))}px; font-weight: 500; color: white; background: transparent; padding: 2px;")
+        # Initials show until a background-decoded image arrives
+        token = self._icon_token = object()
+        pixmap = tile_pixmap(self.app_data, self.parent_window.config.settings,
+                             on_ready=lambda pix: self.on_icon_ready(token, pix), dpr=self.devicePixelRatioF())
+        self.apply_icon(pixmap)
+
+    def on_icon_ready(self, token, pixmap):
+        if token is self._icon_token and pixmap:
+            self.apply_icon(pixmap)
+
+    def apply_icon(self, pixmap):
+        self.pixmap = pixmap
+        self.update()
 
     def resizeEvent(self, event):
-        w = self.width()
-        h = self.height()
-        
-        if self.is_add:
-            self.icon_label.setGeometry(0, 0, w, h)
-            self.text_label.hide()
-        else:
-            is_full = self.app_data.get('full_tile', False)
-            if is_full:
-                self.icon_label.setGeometry(0, 0, w, h)
-                self.text_label.hide()
-            else:
-                text_h = int(h * 0.30)
-                icon_h = h - text_h
-                self.icon_label.setGeometry(0, 0, w, icon_h)
-                self.text_label.setGeometry(5, icon_h, w-10, text_h)
-                self.text_label.show()
-                
-        self.delete_btn.setGeometry(w-30, 0, 25, 25)
+        self.layout_children()
         super().resizeEvent(event)
 
+    def layout_children(self):
+        self.delete_btn.setGeometry(self.width()-30, 0, 25, 25)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -975,14 +2337,22 @@ class MetroTile(QPushButton):
         painter.scale(self._scale, self._scale)
         painter.translate(-c)
         
-        def_color = self.parent_window.config['settings'].get('default_tile_color', '#00a300')
-        bg_color = QColor(self.app_data.get('color', def_color))
+        def_color = self.parent_window.config.settings.default_tile_color
+        bg_color = QColor(self.app_data.color or def_color)
         
         if self.is_add: bg_color = QColor(60, 60, 60)
         
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(bg_color)
         painter.drawRect(self.rect())
+        
+        fonts = tile_fonts(self.parent_window.config.settings.tile_size)
+        paint_tile_face(painter, self.rect(), self.app_data, self.pixmap, self.is_add, fonts)
+        if not self.is_add:
+            paint_run_state(painter, self.rect(), self.parent_window.supervisor.state(self.app_data))
+
+        if self.hovered:
+            paint_hover_border(painter, self.rect())
 
         if self.hasFocus(): 
             painter.setPen(QColor(0, 120, 215))
@@ -1002,19 +2372,13 @@ class MetroTile(QPushButton):
         painter.end() 
 
     def enterEvent(self, event):
-        self.anim.stop()
-        self.anim.setStartValue(self._scale)
-        self.anim.setEndValue(1.05)
-        self.anim.start()
-        self.update_style(hover=True)
+        self.animate_scale(1.05)
+        self.hovered = True
         super().enterEvent(event)
 
     def leaveEvent(self, event):
-        self.anim.stop()
-        self.anim.setStartValue(self._scale)
-        self.anim.setEndValue(1.0)
-        self.anim.start()
-        self.update_style(hover=False)
+        self.animate_scale(1.0)
+        self.hovered = False
         super().leaveEvent(event)
     
     def focusInEvent(self, event):
@@ -1027,30 +2391,16 @@ class MetroTile(QPushButton):
     def mousePressEvent(self, e):
         if e.button() == Qt.MouseButton.LeftButton:
             self.drag_start_position = e.position().toPoint()
-        self.anim.stop()
-        self.anim.setStartValue(self._scale)
-        self.anim.setEndValue(0.95)
-        self.anim.start()
+        self.animate_scale(0.95)
         super().mousePressEvent(e)
 
     def mouseReleaseEvent(self, e):
         super().mouseReleaseEvent(e)
-        self.anim.stop()
-        self.anim.setStartValue(self._scale)
-        self.anim.setEndValue(1.0)
-        self.anim.start()
+        self.animate_scale(1.0)
         
         if self.rect().contains(e.position().toPoint()):
             self.trigger_action()
 
-    def trigger_action(self):
-        if self.is_add: self.parent_window.add_new_item(self.group_index)
-        elif not self.parent_window.is_edit_mode:
-            if self.app_data.get('type') == 'desktop':
-                self.parent_window.toggle_visibility() 
-            else:
-                self.launch_app()
-
     def mouseMoveEvent(self, event):
         if not (event.buttons() & Qt.MouseButton.LeftButton): return
         if self.is_add: return
@@ -1060,29 +2410,17 @@ class MetroTile(QPushButton):
         if (current_pos - self.drag_start_position).manhattanLength() < QApplication.startDragDistance(): return
 
         drag = QDrag(self)
-        mime_data = QMimeData()
-        mime_data.setText(f"{self.group_index}|{self.item_index}")
-        drag.setMimeData(mime_data)
+        drag.setMimeData(tile_mime_data(self.group_index, self.item_index))
         drag.setPixmap(self.grab())
         drag.setHotSpot(current_pos)
         drag.exec(Qt.DropAction.MoveAction)
 
-    def update_style(self, border_color=None, hover=False):
-        if self.drop_target_mode == self._last_drag_target_mode and not hover:
-            return
-        
-        self._last_drag_target_mode = self.drop_target_mode
-        
-        border_css = "border: none;"
-        if hover: border_css = "border: 3px solid rgba(255, 255, 255, 0.5);"
-        self.setStyleSheet(f"MetroTile {{ background-color: transparent; {border_css} }}")
-
     def dragEnterEvent(self, event):
-        if event.source() and isinstance(event.source(), MetroTile): event.accept()
+        if tile_drag_source(event.mimeData()): event.accept()
         else: event.ignore()
 
     def dragMoveEvent(self, event):
-        if event.source() and isinstance(event.source(), MetroTile): 
+        if tile_drag_source(event.mimeData()): 
              pos = event.position().toPoint()
              if pos.x() < self.width() / 2:
                  self.insert_side = 'left'
@@ -1103,212 +2441,232 @@ class MetroTile(QPushButton):
     def dropEvent(self, event):
         self.drop_target_mode = None
         self.update()
-        source_tile = event.source()
-        if source_tile and source_tile != self:
+        source = tile_drag_source(event.mimeData())
+        if source and source != (self.group_index, self.item_index):
             if self.is_add:
-                 self.parent_window.handle_drop(source_tile.group_index, source_tile.item_index, self.group_index, -1)
+                 self.parent_window.handle_drop(source[0], source[1], self.group_index, -1)
             else:
                 offset = 0 if self.insert_side == 'left' else 1
-                self.parent_window.handle_drop(source_tile.group_index, source_tile.item_index, self.group_index, self.item_index + offset)
+                self.parent_window.handle_drop(source[0], source[1], self.group_index, self.item_index + offset)
 
-    def launch_app(self):
-        script = self.app_data.get('script_path')
-        python_exe = self.app_data.get('python_path')
-        
-        if python_exe == "SYSTEM":
-            try: 
-                subprocess.Popen(script.split())
-                self.parent_window.toggle_visibility() 
-            except Exception as e: 
-                self.show_error(str(e))
-            return
-            
-        if not script or not os.path.exists(script):
-            self.show_error(f"Script not found:\n{script}")
-            return
-            
-        cwd = os.path.dirname(script)
-        try:
-            cmd = ['gnome-terminal', '--', 'bash', '-c', f'"{python_exe}" "{script}"; exec bash']
-            subprocess.Popen(cmd, cwd=cwd)
-            self.parent_window.toggle_visibility()
-        except Exception as e:
-            self.show_error(str(e))
+    def dialog_parent(self):
+        return self
 
-    def show_error(self, text):
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Error")
-        msg.setText(text)
-        msg.setWindowFlags(msg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-        msg.exec()
-
-    def request_delete(self):
-        self.parent_window.delete_item(self.group_index, self.item_index)
+    def refresh_tile(self):
+        self.update_content()
+        self.update()
 
     def contextMenuEvent(self, event):
-        if self.is_add: return
-        menu = QMenu(self)
-        menu.setWindowFlags(menu.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-        
-        tile_menu = menu.addMenu("Tile")
-        tile_menu.addAction("Change Color", self.change_color)
-        tile_menu.addAction("Change Icon", self.change_icon)
-        tile_menu.addAction("Remove Icon", self.remove_icon)
-        
-        menu.addAction("Properties", self.edit_details)
-        menu.addSeparator()
-        menu.addAction("Delete", self.request_delete)
-        
-        menu.exec(self.mapToGlobal(event.pos()))
+        self.exec_context_menu(self.mapToGlobal(event.pos()))
 
-    def change_name(self):
-        dlg = QInputDialog(self)
-        dlg.setWindowFlags(dlg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-        dlg.setWindowTitle("Rename")
-        dlg.setLabelText("Name:")
-        dlg.setTextValue(self.app_data['name'])
-        if dlg.exec():
-            new_name = dlg.textValue()
-            if new_name:
-                self.app_data['name'] = new_name
-                self.text_label.setText(new_name)
-                self.parent_window.save_config()
+class TileDeleteButton(QPushButton):
+    # Red "×" badge painted directly, so tiles carry no stylesheet of their own
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
 
-    def change_icon(self):
-        dlg = QFileDialog(self, "Select Icon")
-        dlg.setNameFilter("Images (*.png *.jpg *.svg)")
-        dlg.setWindowFlags(dlg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-        if dlg.exec():
-            files = dlg.selectedFiles()
-            if files:
-                self.app_data['icon'] = files[0]
-                self.update_icon_display()
-                self.parent_window.save_config()
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        paint_delete_badge(painter, self.rect(), self.font())
+        painter.end()
+
+# --- TILE POOL ---
+class TilePool:
+    # Recycles MetroTile widgets across refresh_ui calls. Released tiles are parked
+    # (hidden) under a holder widget and rebound to new app data on acquire.
+    def __init__(self, parent_window, limit=512):
+        self.parent_window = parent_window
+        self.limit = limit
+        self.holder = QWidget()
+        self.free_tiles = []
+        self.free_add_tiles = []
+        self.hits = 0
+        self.misses = 0
+        self.releases = 0
+        self.discards = 0
+
+    def acquire(self, app_data, group_index, item_index, is_add=False):
+        free = self.free_add_tiles if is_add else self.free_tiles
+        if free:
+            self.hits += 1
+            tile = free.pop()
+            tile.rebind(app_data, group_index, item_index)
+            return tile
+        self.misses += 1
+        return MetroTile(app_data, self.parent_window, group_index, item_index, is_add=is_add)
+
+    def release(self, tile):
+        self.releases += 1
+        free = self.free_add_tiles if tile.is_add else self.free_tiles
+        if len(free) >= self.limit:
+            self.discards += 1
+            tile.hide()
+            tile.deleteLater()
+            return
+        tile.reset_for_pool()
+        # Reparenting also removes the tile from its old grid layout
+        tile.setParent(self.holder)
+        free.append(tile)
 
-    def remove_icon(self):
-        self.app_data['icon'] = None
-        self.update_icon_display()
-        self.parent_window.save_config()
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits, "misses": self.misses, "releases": self.releases,
+            "discards": self.discards, "pooled": len(self.free_tiles) + len(self.free_add_tiles),
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
 
-    def change_color(self):
-        initial = QColor(self.app_data.get('color', '#000'))
-        dlg = QColorDialog(initial, self)
-        dlg.setWindowFlags(dlg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-        if dlg.exec():
-            color = dlg.selectedColor()
-            if color.isValid():
-                self.app_data['color'] = color.name()
-                self.update() 
-                self.parent_window.save_config()
+# --- GROUP WIDGET ---
+def group_width(settings):
+    tile_size = settings.tile_size
+    spacing = 4
+    cols = settings.group_columns
+    return (tile_size * cols) + (spacing * (cols-1)) + 40
+
+class GroupPlaceholder(QWidget):
+    # Reserves the width of a GroupWidget that is scrolled out of view
+    def __init__(self, group_data, group_index, width):
+        super().__init__()
+        self.group_data = group_data
+        self.group_index = group_index
+        self.setFixedWidth(width)
 
-    def edit_details(self):
-        dlg = AppEditorDialog(self, self.parent_window, self.app_data)
-        if dlg.exec():
-            self.app_data.update(dlg.get_data())
-            self.parent_window.refresh_ui()
-            self.parent_window.save_config()
+    def sync(self, group_index, width):
+        self.group_index = group_index
+        if self.minimumWidth() != width or self.maximumWidth() != width:
+            self.setFixedWidth(width)
 
-# --- GROUP WIDGET ---
 class GroupWidget(QWidget):
     def __init__(self, parent_window, group_data, group_index):
         super().__init__()
         self.parent_window = parent_window
         self.group_data = group_data
         self.group_index = group_index
-        
-        tile_size = self.parent_window.config['settings'].get('tile_size', 140)
-        spacing = 4
-        cols = self.parent_window.config['settings'].get('group_columns', 2)
-        width = (tile_size * cols) + (spacing * (cols-1)) + 40 
-        self.setFixedWidth(width) 
+        self.tiles = {}
+        self.tile_cells = {}
+        self.add_tile = None
+        self.packed_key = None
+        self.packed = None
         
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 40, 0)
         self.main_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
         header_layout = QHBoxLayout()
-        self.title = QLabel(group_data.get('name', 'Group'))
+        self.title = QLabel(group_data.name)
         self.title.setStyleSheet("color: white; font-size: 20px; font-family: 'Segoe UI Light', sans-serif;")
         header_layout.addWidget(self.title)
         
-        if self.parent_window.is_edit_mode:
-            del_grp = QPushButton("Del")
-            del_grp.setStyleSheet("color: red; background: transparent; border: none;")
-            del_grp.clicked.connect(self.delete_self)
-            header_layout.addWidget(del_grp)
-            
-            rename_grp = QPushButton("Ren")
-            rename_grp.setStyleSheet("color: #aaa; background: transparent; border: none;")
-            rename_grp.clicked.connect(self.rename_self)
-            header_layout.addWidget(rename_grp)
+        self.del_grp = QPushButton("Del")
+        self.del_grp.setStyleSheet("color: red; background: transparent; border: none;")
+        self.del_grp.clicked.connect(self.delete_self)
+        header_layout.addWidget(self.del_grp)
+        
+        self.rename_grp = QPushButton("Ren")
+        self.rename_grp.setStyleSheet("color: #aaa; background: transparent; border: none;")
+        self.rename_grp.clicked.connect(self.rename_self)
+        header_layout.addWidget(self.rename_grp)
 
         self.main_layout.addLayout(header_layout)
+        self.build_body()
+        self.main_layout.addStretch()
 
+    def build_body(self):
         self.grid_widget = QWidget()
         self.grid = QGridLayout(self.grid_widget)
-        self.grid.setSpacing(spacing)
+        self.grid.setSpacing(4)
         self.grid.setContentsMargins(0, 10, 0, 0)
         self.grid.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-        
-        self.populate_grid()
         self.main_layout.addWidget(self.grid_widget)
-        self.main_layout.addStretch()
 
-    def populate_grid(self):
-        apps = self.group_data.get('apps', [])
+    def sync(self, group_index, spare_tiles):
+        # Reconcile this group with its config entry. Tiles are matched by the identity of
+        # their app dict; spare_tiles holds tiles released by other groups so moves reuse them.
+        self.group_index = group_index
+        width = group_width(self.parent_window.config.settings)
+        if self.minimumWidth() != width or self.maximumWidth() != width:
+            self.setFixedWidth(width) 
         
-        grid_map = {} 
-        current_row = 0
-        current_col = 0
-        max_cols = self.parent_window.config['settings'].get('group_columns', 2)
+        name = self.group_data.name
+        if self.title.text() != name: self.title.setText(name)
+        edit_mode = self.parent_window.is_edit_mode
+        self.del_grp.setVisible(edit_mode)
+        self.rename_grp.setVisible(edit_mode)
         
-        def is_occupied(r, c):
-            return grid_map.get((r,c), False)
+        self.populate_grid(spare_tiles)
+
+    def take_tiles(self):
+        # Hand all app tiles over to the caller (used by LauncherWindow.refresh_ui)
+        if self.add_tile is not None: self.release_add_tile()
+        tiles = self.tiles
+        self.tiles = {}
+        self.tile_cells = {}
+        return tiles
+
+    def release_moved_tiles(self, spare_tiles):
+        # Tiles whose app is no longer in this group become available to other groups
+        current = {id(app) for app in self.group_data.apps}
+        for key in [k for k in self.tiles if k not in current]:
+            tile = self.tiles.pop(key)
+            self.tile_cells.pop(tile, None)
+            spare_tiles[key] = tile
+
+    def grid_positions(self, apps, max_cols):
+        # Packing is memoized per group; only a change to the spans or column count repacks
+        settings = self.parent_window.config.settings
+        key = (tuple(tile_span(app, settings) for app in apps), max_cols)
+        if key != self.packed_key:
+            self.packed_key = key
+            self.packed = pack_tiles(*key)
+        return self.packed
+
+    def place(self, tile, cell):
+        # Only touch the grid when the tile actually moved
+        if self.tile_cells.get(tile) == cell and tile.parent() is self.grid_widget: return
+        if tile.parent() is self.grid_widget: self.grid.removeWidget(tile)
+        row, col, w, h = cell
+        self.grid.addWidget(tile, row, col, h, w)
+        self.tile_cells[tile] = cell
+        tile.show()
+
+    def tile_changed(self, app_data):
+        tile = self.tiles.get(id(app_data))
+        if tile is not None: tile.update()
+
+    def populate_grid(self, spare_tiles):
+        apps = self.group_data.apps
+        max_cols = self.parent_window.config.settings.group_columns
+        positions, add_cell = self.grid_positions(apps, max_cols)
         
-        def mark_occupied(r, c):
-            grid_map[(r,c)] = True
-
+        old_tiles = self.tiles
+        self.tiles = {}
         for i, app in enumerate(apps):
-            is_wide = app.get('wide_tile', False)
-            if max_cols < 2: is_wide = False
-            
-            while True:
-                if is_wide:
-                    if current_col + 1 < max_cols and not is_occupied(current_row, current_col) and not is_occupied(current_row, current_col+1):
-                        break
-                    else:
-                        current_col += 1
-                        if current_col >= max_cols:
-                            current_col = 0
-                            current_row += 1
-                else:
-                    if not is_occupied(current_row, current_col):
-                        break
-                    else:
-                        current_col += 1
-                        if current_col >= max_cols:
-                            current_col = 0
-                            current_row += 1
-            
-            tile = MetroTile(app, self.parent_window, self.group_index, i)
-            if self.parent_window.is_edit_mode: tile.delete_btn.show()
-            
-            if is_wide:
-                self.grid.addWidget(tile, current_row, current_col, 1, 2)
-                mark_occupied(current_row, current_col)
-                mark_occupied(current_row, current_col+1)
-            else:
-                self.grid.addWidget(tile, current_row, current_col, 1, 1)
-                mark_occupied(current_row, current_col)
+            key = id(app)
+            tile = old_tiles.pop(key, None) or spare_tiles.pop(key, None)
+            if tile is None:
+                tile = self.parent_window.tile_pool.acquire(app, self.group_index, i)
+            tile.sync(self.group_index, i)
+            self.tiles[key] = tile
+            self.place(tile, positions[i])
+        
+        # Tiles whose app left this group go back to the caller for reuse elsewhere
+        for key, tile in old_tiles.items():
+            self.tile_cells.pop(tile, None)
+            spare_tiles[key] = tile
                 
         if self.parent_window.is_edit_mode:
-            while is_occupied(current_row, current_col):
-                current_col += 1
-                if current_col >= max_cols:
-                    current_col = 0
-                    current_row += 1
-            add_tile = MetroTile({}, self.parent_window, self.group_index, -1, is_add=True)
-            self.grid.addWidget(add_tile, current_row, current_col)
+            if self.add_tile is None:
+                self.add_tile = self.parent_window.tile_pool.acquire(Tile(), self.group_index, -1, is_add=True)
+            self.add_tile.sync(self.group_index, -1)
+            self.place(self.add_tile, add_cell)
+        elif self.add_tile is not None:
+            self.release_add_tile()
+
+    def release_add_tile(self):
+        self.tile_cells.pop(self.add_tile, None)
+        self.parent_window.tile_pool.release(self.add_tile)
+        self.add_tile = None
 
     def delete_self(self):
         msg = QMessageBox(self)
@@ -1324,69 +2682,1450 @@ class GroupWidget(QWidget):
         dlg.setWindowFlags(dlg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
         dlg.setWindowTitle("Rename Group")
         dlg.setLabelText("Name:")
-        dlg.setTextValue(self.group_data['name'])
+        dlg.setTextValue(self.group_data.name)
         if dlg.exec():
             new_name = dlg.textValue()
             if new_name:
-                self.group_data['name'] = new_name
+                self.group_data.name = new_name
                 self.title.setText(new_name)
-                self.parent_window.save_config()
+                self.parent_window.save_config(self.group_data)
+
+# --- CANVAS RENDERER ---
+class TileRecord(TileActions):
+    # Flat description of one tile painted by TileCanvas (no QObject per tile)
+    __slots__ = ('canvas', 'app_data', 'parent_window', 'group_index', 'item_index', 'is_add',
+                 'rect', 'color', 'pixmap', 'state', 'scale')
+
+    def __init__(self, canvas, app_data, group_index, item_index, is_add=False):
+        self.canvas = canvas
+        self.app_data = app_data
+        self.parent_window = canvas.parent_window
+        self.group_index = group_index
+        self.item_index = item_index
+        self.is_add = is_add
+        self.rect = QRect()
+        self.color = None
+        self.pixmap = None
+        self.state = None
+        self.scale = 1.0
+
+    def dialog_parent(self):
+        return self.canvas
+
+    def refresh_tile(self):
+        self.canvas.refresh_record(self)
+
+class TileCanvas(QWidget):
+    # Paints every tile of a group in one paintEvent from a list of TileRecords.
+    # Hit-testing, hover/press scaling, focus, drag and drop and context menus are
+    # handled here instead of by per-tile widgets.
+    SPACING = 4
+    TOP = 10
+
+    def __init__(self, group_widget):
+        super().__init__()
+        self.group_widget = group_widget
+        self.parent_window = group_widget.parent_window
+        self.records = []
+        self.cells = {}
+        self.hover = None
+        self.pressed = None
+        self.pressed_delete = False
+        self.drop_target = None
+        self.insert_side = 'left'
+        self.focus_index = -1
+        self.drag_start_position = None
+        self.tile_size = 140
+        
+        self.setMouseTracking(True)
+        self.setAcceptDrops(True)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+
+    def set_tiles(self, apps, positions, add_cell):
+        settings = self.parent_window.config.settings
+        size = settings.tile_size
+        cols = settings.group_columns
+        step = size + self.SPACING
+        self.tile_size = size
+        self.fonts = tile_fonts(size)
+        
+        old = {id(r.app_data): r for r in self.records if not r.is_add}
+        group_index = self.group_widget.group_index
+        records = []
+        cells = {}
+        cells_spec = list(zip(apps, positions))
+        if add_cell is not None: cells_spec.append((None, add_cell))
+        
+        bottom = 0
+        for i, (app, (row, col, w, h)) in enumerate(cells_spec):
+            if app is None:
+                rec = TileRecord(self, Tile(), group_index, -1, is_add=True)
+            else:
+                rec = old.pop(id(app), None) or TileRecord(self, app, group_index, i)
+                rec.group_index = group_index
+                rec.item_index = i
+            rec.rect = QRect(col * step, self.TOP + row * step, *span_size((w, h), size, self.SPACING))
+            self.update_record(rec)
+            records.append(rec)
+            for r in range(row, row + h):
+                for c in range(col, col + w):
+                    cells[(r, c)] = rec
+            bottom = max(bottom, rec.rect.bottom() + 1)
+        
+        self.records = records
+        self.cells = cells
+        if self.hover not in records: self.hover = None
+        if self.focus_index >= len(records): self.focus_index = len(records) - 1
+        self.setFixedSize((size * cols) + self.SPACING * (cols - 1), max(bottom, self.TOP))
+        self.update()
+
+    def update_record(self, rec, force=False):
+        # Colors and pixmaps are resolved once per change, never per paint
+        settings = self.parent_window.config.settings
+        state = (rec.app_data.astuple(), settings.tile_size, settings.group_columns,
+                 settings.default_tile_color, rec.rect.size(), self.devicePixelRatioF())
+        if state == rec.state and not force: return
+        rec.state = state
+        if rec.is_add:
+            rec.color = QColor(60, 60, 60)
+            rec.pixmap = None
+        else:
+            rec.color = QColor(rec.app_data.color or settings.default_tile_color)
+            rec.pixmap = tile_pixmap(rec.app_data, settings,
+                                     on_ready=lambda pix, rec=rec, state=state: self.on_icon_ready(rec, state, pix),
+                                     dpr=self.devicePixelRatioF())
+
+    def on_icon_ready(self, rec, state, pixmap):
+        if rec.state is state and pixmap:
+            rec.pixmap = pixmap
+            self.update(self.dirty_rect(rec))
+
+    def refresh_record(self, rec):
+        self.update_record(rec, force=True)
+        self.update(self.dirty_rect(rec))
+
+    def dirty_rect(self, rec):
+        margin = int(max(rec.rect.width(), rec.rect.height()) * 0.03) + 3
+        return rec.rect.adjusted(-margin, -margin, margin, margin)
+
+    def record_at(self, pos):
+        step = self.tile_size + self.SPACING
+        if pos.y() < self.TOP: return None
+        rec = self.cells.get(((pos.y() - self.TOP) // step, pos.x() // step))
+        if rec and rec.rect.contains(pos): return rec
+        return None
+
+    def delete_rect(self, rec):
+        return QRect(rec.rect.right() - 29, rec.rect.top(), 25, 25)
+
+    # --- painting ---
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        clip = event.rect()
+        focused = self.focus_index if self.hasFocus() else -1
+        for i, rec in enumerate(self.records):
+            if self.dirty_rect(rec).intersects(clip):
+                self.paint_record(painter, rec, i == focused)
+        painter.end()
+
+    def paint_record(self, painter, rec, focused=False):
+        painter.save()
+        r = rec.rect
+        if rec.scale != 1.0:
+            c = QRectF(r).center()
+            painter.translate(c)
+            painter.scale(rec.scale, rec.scale)
+            painter.translate(-c)
+        
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(rec.color)
+        painter.drawRect(r)
+        
+        paint_tile_face(painter, r, rec.app_data, rec.pixmap, rec.is_add, self.fonts)
+        if not rec.is_add:
+            paint_run_state(painter, r, self.parent_window.supervisor.state(rec.app_data))
+        
+        if rec is self.hover:
+            paint_hover_border(painter, r)
+        
+        if focused:
+            painter.setPen(QColor(0, 120, 215))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRect(r.adjusted(1,1,-1,-1))
+            painter.drawRect(r.adjusted(4,4,-4,-4))
+        
+        # Draw Insertion Line
+        if rec is self.drop_target and not rec.is_add:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(255, 255, 255))
+            if self.insert_side == 'left':
+                painter.drawRect(r.x(), r.y(), 4, r.height())
+            else:
+                painter.drawRect(r.right() - 3, r.y(), 4, r.height())
+        
+        if self.parent_window.is_edit_mode and not rec.is_add:
+            paint_delete_badge(painter, self.delete_rect(rec), self.fonts[2])
+        painter.restore()
+
+    def record_pixmap(self, rec):
+        pix = QPixmap(rec.rect.size())
+        pix.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pix)
+        painter.translate(-rec.rect.topLeft())
+        scale = rec.scale
+        rec.scale = 1.0
+        self.paint_record(painter, rec)
+        rec.scale = scale
+        painter.end()
+        return pix
+
+    # --- hover / press animation ---
+    def animate(self, rec, end):
+        self.parent_window.animator.animate(rec, rec.scale, end, lambda v: self.set_scale(rec, v))
+
+    def set_scale(self, rec, value):
+        rec.scale = value
+        self.update(self.dirty_rect(rec))
+
+    def set_hover(self, rec):
+        if rec is self.hover: return
+        old = self.hover
+        self.hover = rec
+        if old is not None: self.animate(old, 1.0)
+        if rec is not None: self.animate(rec, 1.05)
+
+    def mouseMoveEvent(self, event):
+        pos = event.position().toPoint()
+        if not (event.buttons() & Qt.MouseButton.LeftButton):
+            self.set_hover(self.record_at(pos))
+            return
+        rec = self.pressed
+        if rec is None or rec.is_add or self.drag_start_position is None: return
+        if (pos - self.drag_start_position).manhattanLength() < QApplication.startDragDistance(): return
+        
+        drag = QDrag(self)
+        drag.setMimeData(tile_mime_data(rec.group_index, rec.item_index))
+        drag.setPixmap(self.record_pixmap(rec))
+        drag.setHotSpot(pos - rec.rect.topLeft())
+        self.pressed = None
+        self.drag_start_position = None
+        drag.exec(Qt.DropAction.MoveAction)
+        self.animate(rec, 1.0)
+
+    def leaveEvent(self, event):
+        self.set_hover(None)
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, e):
+        rec = self.record_at(e.position().toPoint())
+        if rec is None: return
+        self.focus_index = self.records.index(rec)
+        self.setFocus(Qt.FocusReason.MouseFocusReason)
+        if e.button() != Qt.MouseButton.LeftButton: return
+        self.pressed = rec
+        self.drag_start_position = e.position().toPoint()
+        self.pressed_delete = self.parent_window.is_edit_mode and not rec.is_add and self.delete_rect(rec).contains(self.drag_start_position)
+        self.animate(rec, 0.95)
+
+    def mouseReleaseEvent(self, e):
+        rec = self.pressed
+        self.pressed = None
+        self.drag_start_position = None
+        if rec is None: return
+        self.animate(rec, 1.0)
+        pos = e.position().toPoint()
+        if self.record_at(pos) is not rec: return
+        if self.pressed_delete and self.delete_rect(rec).contains(pos):
+            rec.request_delete()
+        else:
+            rec.trigger_action()
+
+    # --- keyboard focus ---
+    def focusInEvent(self, event):
+        if self.records and self.focus_index < 0:
+            back = event.reason() == Qt.FocusReason.BacktabFocusReason
+            self.focus_index = len(self.records) - 1 if back else 0
+        self.update()
+        super().focusInEvent(event)
+
+    def focusOutEvent(self, event):
+        self.update()
+        super().focusOutEvent(event)
+
+    def move_focus(self, delta):
+        index = self.focus_index + delta
+        if not (0 <= index < len(self.records)): return False
+        old = self.records[self.focus_index] if self.focus_index >= 0 else None
+        self.focus_index = index
+        if old is not None: self.update(self.dirty_rect(old))
+        self.update(self.dirty_rect(self.records[index]))
+        return True
+
+    def focusNextPrevChild(self, next):
+        if self.hasFocus() and self.move_focus(1 if next else -1): return True
+        self.focus_index = -1
+        return super().focusNextPrevChild(next)
+
+    def keyPressEvent(self, event):
+        key = event.key()
+        if key in (Qt.Key.Key_Left, Qt.Key.Key_Up):
+            if self.move_focus(-1): return
+        elif key in (Qt.Key.Key_Right, Qt.Key.Key_Down):
+            if self.move_focus(1): return
+        elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter, Qt.Key.Key_Space):
+            if 0 <= self.focus_index < len(self.records):
+                self.records[self.focus_index].trigger_action()
+                return
+        super().keyPressEvent(event)
+
+    def contextMenuEvent(self, event):
+        rec = self.record_at(event.pos())
+        if rec is None and event.reason() == event.Reason.Keyboard and 0 <= self.focus_index < len(self.records):
+            rec = self.records[self.focus_index]
+        if rec is not None:
+            rec.exec_context_menu(self.mapToGlobal(event.pos()))
+
+    # --- drag and drop ---
+    def dragEnterEvent(self, event):
+        if tile_drag_source(event.mimeData()): event.accept()
+        else: event.ignore()
+
+    def dragMoveEvent(self, event):
+        if not tile_drag_source(event.mimeData()): return
+        pos = event.position().toPoint()
+        rec = self.record_at(pos)
+        old = self.drop_target
+        self.drop_target = rec
+        if rec is not None:
+            self.insert_side = 'left' if pos.x() < rec.rect.center().x() else 'right'
+            self.update(self.dirty_rect(rec))
+        if old is not None and old is not rec: self.update(self.dirty_rect(old))
+        event.setDropAction(Qt.DropAction.MoveAction)
+        event.accept()
+
+    def dragLeaveEvent(self, event):
+        if self.drop_target is not None: self.update(self.dirty_rect(self.drop_target))
+        self.drop_target = None
+        super().dragLeaveEvent(event)
+
+    def dropEvent(self, event):
+        rec = self.drop_target
+        self.drop_target = None
+        if rec is not None: self.update(self.dirty_rect(rec))
+        source = tile_drag_source(event.mimeData())
+        if not source: return
+        group_index = self.group_widget.group_index
+        # Dropping on the add tile or on empty space appends, like MetroTile's add tile
+        if rec is None or rec.is_add:
+            self.parent_window.handle_drop(source[0], source[1], group_index, -1)
+        elif source != (group_index, rec.item_index):
+            offset = 0 if self.insert_side == 'left' else 1
+            self.parent_window.handle_drop(source[0], source[1], group_index, rec.item_index + offset)
+
+class CanvasGroupWidget(GroupWidget):
+    # GroupWidget variant that paints its tiles on a single TileCanvas
+    def build_body(self):
+        self.canvas = TileCanvas(self)
+        self.main_layout.addWidget(self.canvas)
+
+    def tile_changed(self, app_data):
+        rec = next((rec for rec in self.canvas.records if rec.app_data is app_data), None)
+        if rec is not None: self.canvas.update(self.canvas.dirty_rect(rec))
+
+    def populate_grid(self, spare_tiles):
+        apps = self.group_data.apps
+        max_cols = self.parent_window.config.settings.group_columns
+        positions, add_cell = self.grid_positions(apps, max_cols)
+        self.canvas.set_tiles(apps, positions, add_cell if self.parent_window.is_edit_mode else None)
+
+# --- CONFIG PERSISTENCE ---
+class ConfigWriter:
+    # Serialized, crash-safe config saves on a background thread. submit() takes a snapshot
+    # (compact json.dumps, the cheapest copy) on the caller's thread and replaces any snapshot
+    # still waiting, so overlapping saves coalesce into one write. Each write goes to a temp
+    # file, is fsynced and renamed over the config; the previous file is kept in rotating backups.
+    BACKUPS = 3
+    BACKUP_INTERVAL = 600 # Rotate at most every 10 minutes so backups span real history
+
+    def __init__(self, path, backups=BACKUPS):
+        self.path = os.path.abspath(path)
+        self.backups = backups
+        self.cond = threading.Condition()
+        self.pending = None
+        self.busy = False
+        self.closed = False
+        self.writes = 0
+        self.thread = threading.Thread(target=self.run, name="lumex8-config-writer", daemon=True)
+        self.thread.start()
+
+    def backup_path(self, n):
+        return f"{self.path}.{n}"
+
+    def submit(self, config):
+        snapshot = json.dumps(config.to_dict())
+        with self.cond:
+            self.pending = snapshot
+            self.cond.notify_all()
+
+    def flush(self, timeout=None):
+        # Wait until everything submitted so far is on disk; False if the timeout ran out
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.cond:
+            while self.pending is not None or self.busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0: return False
+                self.cond.wait(remaining)
+        return True
+
+    def close(self, timeout=None):
+        done = self.flush(timeout)
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        return done
+
+    def run(self):
+        while True:
+            with self.cond:
+                while self.pending is None and not self.closed:
+                    self.cond.wait()
+                if self.pending is None: return
+                snapshot = self.pending
+                self.pending = None
+                self.busy = True
+            try:
+                self.write(snapshot)
+            except (OSError, ValueError) as e:
+                log.warning("could not save %s: %s", self.path, e)
+            finally:
+                with self.cond:
+                    self.busy = False
+                    self.cond.notify_all()
+
+    def write(self, snapshot):
+        start = time.perf_counter()
+        text = json.dumps(json.loads(snapshot), indent=4)
+        directory = os.path.dirname(self.path)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        self.rotate_backups()
+        os.replace(tmp, self.path)
+        try:
+            # Make the rename itself durable
+            fd = os.open(directory, os.O_RDONLY)
+            try: os.fsync(fd)
+            finally: os.close(fd)
+        except OSError: pass
+        self.writes += 1
+        log.debug("saved %s (%d bytes) in %.1f ms", self.path, len(text), (time.perf_counter() - start) * 1000)
+
+    def rotate_backups(self):
+        if self.backups < 1 or not os.path.exists(self.path): return
+        newest = self.backup_path(1)
+        try:
+            if time.time() - os.stat(newest).st_mtime < self.BACKUP_INTERVAL: return
+        except OSError: pass
+        for n in range(self.backups - 1, 0, -1):
+            if os.path.exists(self.backup_path(n)):
+                os.replace(self.backup_path(n), self.backup_path(n + 1))
+        # The current file stays in place until the new one replaces it
+        try: os.link(self.path, newest)
+        except OSError: shutil.copy2(self.path, newest)
+        os.utime(newest)
+
+    def candidates(self):
+        # Config file first, then backups newest to oldest (used when loading)
+        return [self.path] + [self.backup_path(n) for n in range(1, self.backups + 1)]
+
+class ConfigStore:
+    # Optional SQLite backend (settings.storage == 'sqlite') holding the same document as
+    # config.json: one row per group, per app and per top-level section, plus the recent themes.
+    # Callers mark() what they changed; sync() then looks at those records only and writes the
+    # rows that differ from what the store last held, and update_app() turns a single tile edit
+    # into a one-row transaction. Positions are sparse sort keys (see order_keys).
+    VERSION = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS sections (name TEXT PRIMARY KEY, data TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS groups (id INTEGER PRIMARY KEY, position INTEGER NOT NULL, data TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS apps (id INTEGER PRIMARY KEY, group_id INTEGER NOT NULL, position INTEGER NOT NULL, data TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS themes (position INTEGER PRIMARY KEY, data TEXT NOT NULL);
+            """)
+            self.conn.execute(f"PRAGMA user_version={self.VERSION}")
+        # Last written state, keyed by the identity of the live records in self.config; each
+        # entry keeps the record itself so a recycled id() is never mistaken for it
+        self.sections = {}   # name -> text
+        self.group_rows = {} # id(group) -> [row_id, key, text, group]
+        self.app_rows = {}   # id(app) -> [row_id, group_row_id, key, text, app]
+        self.members = {}    # group row_id -> {id(app)}
+        self.themes = None
+        self.row_writes = 0
+        # What sync() has to look at: marked records only, everything when full
+        self.full = True
+        self.groups_dirty = False
+        self.dirty_groups = {}
+        self.dirty_apps = {}
+
+    def is_empty(self):
+        return self.conn.execute("SELECT NOT EXISTS (SELECT 1 FROM sections)").fetchone()[0]
+
+    def load(self):
+        # Rebuild the document, then key the row caches by the Config records made from it.
+        # A document that needed migration is written back in full on the next sync.
+        doc = {}
+        sections = {}
+        for name, text in self.conn.execute("SELECT name, data FROM sections"):
+            doc[name] = json.loads(text)
+            sections[name] = text
+        groups = []
+        group_rows = []
+        app_rows = []
+        by_row = {}
+        for row_id, key, text in self.conn.execute("SELECT id, position, data FROM groups ORDER BY position"):
+            group = json.loads(text)
+            group['apps'] = []
+            groups.append(group)
+            by_row[row_id] = (group, [])
+            group_rows.append([row_id, key, text])
+            app_rows.append(by_row[row_id][1])
+        for row_id, group_id, key, text in self.conn.execute(
+                "SELECT id, group_id, position, data FROM apps ORDER BY group_id, position"):
+            if group_id not in by_row: continue
+            group, rows = by_row[group_id]
+            group['apps'].append(json.loads(text))
+            rows.append([row_id, group_id, key, text])
+        doc['groups'] = groups
+        doc['recent_themes'] = [json.loads(text) for (text,) in self.conn.execute("SELECT data FROM themes ORDER BY position")]
+        migrated = doc.get('version') != CONFIG_VERSION
+        config = Config.from_dict(doc)
+        self.sections = sections
+        self.group_rows = {id(group): row + [group] for group, row in zip(config.groups, group_rows)}
+        self.app_rows = {}
+        self.members = {}
+        for group, rows in zip(config.groups, app_rows):
+            self.members[self.group_rows[id(group)][0]] = {id(app) for app in group.apps}
+            for app, row in zip(group.apps, rows): self.app_rows[id(app)] = row + [app]
+        self.themes = json.dumps(config.recent_themes)
+        self.full = migrated
+        self.groups_dirty = False
+        self.dirty_groups = {}
+        self.dirty_apps = {}
+        return config
+
+    def mark(self, *records):
+        # Records changed since the last sync: a Tile (content), a Group (name or which tiles
+        # it holds, in which order) or the Config (which groups, in which order)
+        for record in records:
+            if isinstance(record, Tile): self.dirty_apps[id(record)] = record
+            elif isinstance(record, Group): self.dirty_groups[id(record)] = record
+            elif isinstance(record, Config): self.groups_dirty = True
+
+    @staticmethod
+    def order_keys(keys):
+        # Sort keys for a list whose items carry keys from the last sync (None: new here).
+        # Items on the longest increasing run keep theirs; the others get keys between their
+        # neighbours, so moving one tile rewrites one row. None if the gaps ran out.
+        tails = []
+        tail_at = []
+        prev = [None] * len(keys)
+        for i, key in enumerate(keys):
+            if key is None: continue
+            j = bisect.bisect_left(tails, key)
+            if j: prev[i] = tail_at[j - 1]
+            if j == len(tails):
+                tails.append(key)
+                tail_at.append(i)
+            else:
+                tails[j] = key
+                tail_at[j] = i
+        kept = set()
+        i = tail_at[-1] if tail_at else None
+        while i is not None:
+            kept.add(i)
+            i = prev[i]
+        result = list(keys)
+        lo = None
+        i = 0
+        while i < len(keys):
+            if i in kept:
+                lo = keys[i]
+                i += 1
+                continue
+            end = i
+            while end < len(keys) and end not in kept: end += 1
+            hi = keys[end] if end < len(keys) else None
+            count = end - i
+            for n in range(count):
+                if lo is None and hi is None: key = float(n + 1)
+                elif hi is None: key = lo + n + 1.0
+                elif lo is None: key = hi - (count - n)
+                else: key = lo + (hi - lo) * (n + 1) / (count + 1)
+                before = result[i + n - 1] if n else lo
+                if (before is not None and key <= before) or (hi is not None and key >= hi): return None
+                result[i + n] = key
+            lo = result[end - 1]
+            i = end
+        return result
+
+    def sync(self, config):
+        # Write what was marked since the last sync. The cost follows the size of the change,
+        # not of the layout: only marked tiles are serialized, only marked groups are walked,
+        # and sparse (fractional) order keys mean a move rewrites the moved row alone.
+        start = time.perf_counter()
+        writes = 0
+        if self.full:
+            self.groups_dirty = True
+            self.dirty_groups = {id(g): g for g in config.groups}
+            self.dirty_apps = {id(a): a for g in config.groups for a in g.apps}
+        with self.conn:
+            names = set()
+            for name, value in config.sections().items():
+                names.add(name)
+                text = json.dumps(value)
+                if self.sections.get(name) != text:
+                    self.conn.execute("INSERT OR REPLACE INTO sections (name, data) VALUES (?, ?)", (name, text))
+                    self.sections[name] = text
+                    writes += 1
+            for name in set(self.sections) - names:
+                self.conn.execute("DELETE FROM sections WHERE name = ?", (name,))
+                del self.sections[name]
+                writes += 1
+            
+            themes = json.dumps(config.recent_themes)
+            if themes != self.themes:
+                self.conn.execute("DELETE FROM themes")
+                self.conn.executemany("INSERT INTO themes (position, data) VALUES (?, ?)",
+                                      [(i, json.dumps(t)) for i, t in enumerate(config.recent_themes)])
+                self.themes = themes
+                writes += 1
+            
+            deleted = []
+            if self.groups_dirty:
+                count, deleted = self.sync_group_list(config)
+                writes += count
+            left = {} # id(app) -> group row it was seen leaving
+            for group in self.dirty_groups.values():
+                row = self.group_rows.get(id(group))
+                if row is None or row[3] is not group: continue # deleted since it was marked
+                text = json.dumps(group.to_dict(with_apps=False))
+                if text != row[2]:
+                    self.conn.execute("UPDATE groups SET data = ? WHERE id = ?", (text, row[0]))
+                    row[2] = text
+                    writes += 1
+                writes += self.sync_group_apps(row[0], group, left)
+            # Tiles that left a group without turning up in another one were deleted
+            for key, group_row in left.items():
+                arow = self.app_rows.get(key)
+                if arow is not None and arow[1] == group_row:
+                    self.conn.execute("DELETE FROM apps WHERE id = ?", (arow[0],))
+                    del self.app_rows[key]
+                    writes += 1
+            writes += self.delete_groups(deleted)
+            for key, app in self.dirty_apps.items():
+                arow = self.app_rows.get(key)
+                if arow is None or arow[4] is not app: continue # deleted, or new in an unmarked group
+                text = json.dumps(app.to_dict())
+                if text != arow[3]:
+                    self.conn.execute("UPDATE apps SET data = ? WHERE id = ?", (text, arow[0]))
+                    arow[3] = text
+                    writes += 1
+        self.full = False
+        self.groups_dirty = False
+        self.dirty_groups = {}
+        self.dirty_apps = {}
+        self.row_writes += writes
+        log.debug("config store: %d rows written in %.1f ms", writes, (time.perf_counter() - start) * 1000)
+
+    def sync_group_list(self, config):
+        writes = 0
+        rows = []
+        for group in config.groups:
+            row = self.group_rows.get(id(group))
+            if row is not None and row[3] is not group: row = None
+            rows.append(row)
+        keys = self.order_keys([row[1] if row else None for row in rows])
+        if keys is None: keys = [float(i + 1) for i in range(len(rows))]
+        seen = set()
+        for group, row, key in zip(config.groups, rows, keys):
+            if row is None:
+                text = json.dumps(group.to_dict(with_apps=False))
+                row_id = self.conn.execute("INSERT INTO groups (position, data) VALUES (?, ?)", (key, text)).lastrowid
+                row = self.group_rows[id(group)] = [row_id, key, text, group]
+                self.members[row_id] = set()
+                self.dirty_groups[id(group)] = group # its tiles are new rows too
+                writes += 1
+            elif row[1] != key:
+                self.conn.execute("UPDATE groups SET position = ? WHERE id = ?", (key, row[0]))
+                row[1] = key
+                writes += 1
+            seen.add(row[0])
+        gone = [gid for gid, row in self.group_rows.items() if row[0] not in seen]
+        return writes, [self.group_rows.pop(gid)[0] for gid in gone]
+
+    def delete_groups(self, group_rows):
+        # After the tile pass, so tiles moved out of a deleted group have been re-parented
+        for group_row in group_rows:
+            self.conn.execute("DELETE FROM groups WHERE id = ?", (group_row,))
+            self.conn.execute("DELETE FROM apps WHERE group_id = ?", (group_row,))
+            for key in self.members.pop(group_row, ()):
+                arow = self.app_rows.get(key)
+                if arow is not None and arow[1] == group_row: del self.app_rows[key]
+        return len(group_rows)
+
+    def sync_group_apps(self, group_row, group, left):
+        writes = 0
+        rows = []
+        for app in group.apps:
+            arow = self.app_rows.get(id(app))
+            if arow is not None and arow[4] is not app:
+                # id() recycled by a new tile: the old tile is gone
+                self.conn.execute("DELETE FROM apps WHERE id = ?", (arow[0],))
+                self.members.get(arow[1], set()).discard(id(app))
+                del self.app_rows[id(app)]
+                writes += 1
+                arow = None
+            rows.append(arow)
+        keys = self.order_keys([arow[2] if arow and arow[1] == group_row else None for arow in rows])
+        if keys is None:
+            keys = [float(i + 1) for i in range(len(rows))]
+        old = self.members.get(group_row, set())
+        new = set()
+        for app, arow, key in zip(group.apps, rows, keys):
+            new.add(id(app))
+            if arow is None:
+                text = json.dumps(app.to_dict())
+                row_id = self.conn.execute("INSERT INTO apps (group_id, position, data) VALUES (?, ?, ?)",
+                                           (group_row, key, text)).lastrowid
+                self.app_rows[id(app)] = [row_id, group_row, key, text, app]
+                writes += 1
+            elif arow[1:3] != [group_row, key]:
+                if arow[1] != group_row: self.members.get(arow[1], set()).discard(id(app))
+                self.conn.execute("UPDATE apps SET group_id = ?, position = ? WHERE id = ?", (group_row, key, arow[0]))
+                arow[1:3] = [group_row, key]
+                writes += 1
+        for key in old - new: left[key] = group_row
+        self.members[group_row] = new
+        return writes
+
+    def update_app(self, app):
+        # Single-row save for an edited tile; False if the app is unknown (caller falls back to sync)
+        arow = self.app_rows.get(id(app))
+        if arow is None or arow[4] is not app: return False
+        text = json.dumps(app.to_dict())
+        if text != arow[3]:
+            with self.conn:
+                self.conn.execute("UPDATE apps SET data = ? WHERE id = ?", (text, arow[0]))
+            arow[3] = text
+            self.row_writes += 1
+        return True
+
+    def close(self):
+        self.conn.close()
+
+# --- FAST START ---
+# Opt-in per interpreter (Settings.fast_start): a warm forkserver runs with the configured
+# modules imported, and each script tile forks from it instead of starting gnome-terminal,
+# bash and a cold interpreter. The forked script gets its own cwd, argv, sys.path[0] and a
+# pty for stdin/stdout/stderr; what it prints is appended to a log under CACHE_DIR/runs.
+# Protocol over AF_UNIX SOCK_SEQPACKET sockets: the server says "ready" on the control socket
+# once its modules are imported, each request carries a fresh channel socket on which the run
+# reports "pid N", "main <CLOCK_MONOTONIC>" and "exit N".
+FORKSERVER_SOURCE = r'''
+import os, sys, json, time, types, socket, signal, pty, termios, importlib
+ctl = socket.socket(fileno=int(sys.argv[1]))
+if not hasattr(socket, "recv_fds") or not hasattr(os, "waitstatus_to_exitcode"):
+    sys.exit("lumex8 fast start: needs Python 3.9 or newer")
+for name in sys.argv[2:]:
+    try: importlib.import_module(name)
+    except Exception as e: print(f"lumex8 fast start: cannot preload {name}: {e}", file=sys.stderr)
+ctl.send(b"ready")
+signal.signal(signal.SIGCHLD, signal.SIG_IGN) # monitors are reaped by the kernel
+req = None
+
+def report(msg):
+    # Lumex8 may have quit or restarted; the script runs and logs regardless
+    try: chan.send(msg)
+    except OSError: pass
+while True:
+    try: msg, fds, _, _ = socket.recv_fds(ctl, 65536, 1)
+    except OSError: break
+    if not msg: break # Lumex8 closed the control socket
+    if os.fork():
+        for fd in fds: os.close(fd)
+        continue
+    # Monitor: owns the pty master, copies output to the log and reports the exit code
+    ctl.close()
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    req, chan = json.loads(msg), socket.socket(fileno=fds[0])
+    pid, master = pty.fork()
+    if pid == 0: break # the script runs below the loop
+    report(b"pid %d" % pid)
+    # Nobody types into this pty: make the script's first stdin read see end of file, unechoed
+    attrs = termios.tcgetattr(master)
+    attrs[3] &= ~termios.ECHO
+    termios.tcsetattr(master, termios.TCSANOW, attrs)
+    os.write(master, b"\x04")
+    with open(req["log"], "ab") as out:
+        out.write(b"--- %s %s (pid %d)\n" % (time.strftime("%Y-%m-%d %H:%M:%S").encode(), req["script"].encode(), pid))
+        while True:
+            try: data = os.read(master, 65536)
+            except OSError: break # EIO once the script and its children closed the pty
+            if not data: break
+            out.write(data)
+            out.flush()
+    _, status = os.waitpid(pid, 0)
+    report(b"exit %d" % os.waitstatus_to_exitcode(status))
+    os._exit(0)
+if req is None: sys.exit(0)
+script = req["script"]
+os.chdir(req["cwd"] or os.path.dirname(script) or ".")
+sys.argv = [script, *req["args"]]
+sys.path[0] = os.path.dirname(os.path.abspath(script))
+sys.stdout.reconfigure(line_buffering=True)
+with open(script, "rb") as f: code = compile(f.read(), script, "exec")
+main = types.ModuleType("__main__")
+main.__file__ = script
+main.__builtins__ = __builtins__
+sys.modules["__main__"] = main
+report(b"main %.6f" % time.monotonic())
+chan.close()
+exec(code, main.__dict__)
+'''
+
+def parse_fast_start(text):
+    # "python: module, module" per line -> {python: [modules]}
+    mapping = {}
+    for line in text.splitlines():
+        python, _, modules = line.strip().partition(":")
+        if not python.strip(): continue
+        mapping[python.strip()] = [m.strip() for m in modules.split(",") if m.strip()]
+    return mapping
+
+def format_fast_start(mapping):
+    return "\n".join(f"{python}: {', '.join(modules)}" for python, modules in mapping.items())
+
+def run_log_path(script):
+    stem = os.path.splitext(os.path.basename(script))[0] or "script"
+    return os.path.join(CACHE_DIR, "runs", f"{stem}-{hashlib.sha1(script.encode()).hexdigest()[:8]}.log")
+
+class ForkServer:
+    # The warm interpreter for one python_path. It exits by itself when its control socket closes.
+    def __init__(self, python, modules):
+        self.python = python
+        self.modules = tuple(modules)
+        self.ready = False
+        self.failed = False # exited before it was ready, reported once
+        self.ctl, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        try:
+            self.popen = subprocess.Popen([python, '-c', FORKSERVER_SOURCE, str(theirs.fileno()), *self.modules],
+                                          pass_fds=(theirs.fileno(),), stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+        except OSError:
+            self.ctl.close()
+            raise
+        finally:
+            theirs.close()
+
+    def alive(self):
+        return self.popen.poll() is None
+
+    def check_ready(self):
+        # Until the server has imported its modules (or if it died doing so) scripts use their normal backend
+        if not self.ready:
+            try: self.ready = self.ctl.recv(16, socket.MSG_DONTWAIT) == b"ready"
+            except OSError: pass
+        return self.ready
+
+    def spawn(self, script, cwd):
+        # Called from a spawn worker, once check_ready()
+        path = run_log_path(script)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        request = json.dumps({"script": script, "cwd": cwd, "args": [], "log": path}).encode()
+        mine, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        try: socket.send_fds(self.ctl, [request], [theirs.fileno()])
+        except OSError:
+            mine.close()
+            raise
+        finally:
+            theirs.close()
+        return FastStartProcess(mine)
+
+    def close(self):
+        self.ctl.close()
+
+class FastStartProcess:
+    # Popen stand-in for a script run by a ForkServer, fed by the messages on its channel
+    def __init__(self, sock):
+        self.sock = sock
+        self.sock.setblocking(False)
+        self.pid = None
+        self.main_at = None # CLOCK_MONOTONIC, comparable with time.monotonic() here
+        self.returncode = None
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def poll(self):
+        while self.returncode is None:
+            try: msg = self.sock.recv(64)
+            except BlockingIOError: break
+            except OSError: msg = b""
+            if not msg:
+                self.returncode = -1 # the forkserver went away without a report (lost() if before the fork)
+                break
+            key, _, value = msg.decode().partition(" ")
+            if key == "pid": self.pid = int(value)
+            elif key == "main": self.main_at = float(value)
+            elif key == "exit": self.returncode = int(value)
+        return self.returncode
+
+    def lost(self):
+        return self.returncode == -1 and self.pid is None
+
+    def close(self):
+        self.sock.close()
+
+# --- PROCESS SUPERVISOR ---
+class ProcessRun:
+    # One launch of a tile: spawn error or exit code, and how long it ran
+    __slots__ = ('tile', 'argv', 'backend', 'popen', 'started', 'ended', 'returncode', 'error', 'pidfd', 'notifier',
+                 'main_ms')
+
+    def __init__(self, tile, argv, backend=None):
+        self.tile = tile
+        self.argv = argv
+        self.backend = backend # launch_mode() result, or 'fast start'
+        self.popen = None
+        self.started = time.monotonic()
+        self.ended = None
+        self.returncode = None
+        self.error = None
+        self.pidfd = None
+        self.notifier = None
+        self.main_ms = None # fast start: click to the script's __main__
+
+    @property
+    def failed(self):
+        return self.error is not None or (self.ended is not None and self.returncode != 0)
+
+    def runtime(self):
+        return (self.ended if self.ended is not None else time.monotonic()) - self.started
+
+    def describe(self):
+        if self.error is not None: return f"failed to start ({self.error})"
+        if self.ended is None: return f"running for {self.runtime():.0f} s"
+        return f"exit code {self.returncode} after {self.runtime():.1f} s"
+
+class SpawnTask(QRunnable):
+    def __init__(self, supervisor, proc, cwd, required, output=None, server=None):
+        super().__init__()
+        self.supervisor = supervisor
+        self.proc = proc
+        self.cwd = cwd
+        self.required = required
+        self.output = output
+        self.server = server
+
+    def run(self):
+        # Path checks and exec can block on a slow mount, so neither runs on the GUI thread
+        try:
+            if self.required and not os.path.exists(self.required):
+                raise FileNotFoundError(f"Script not found: {self.required}")
+            result = None
+            if self.server is not None:
+                try: result = self.server.spawn(self.required, self.cwd)
+                except OSError as e:
+                    self.proc.backend = launch_mode(self.proc.tile, self.supervisor.default_mode)
+                    log.warning("fast start failed for %s (%s), using %s", self.required, e, self.proc.backend)
+            if result is None and self.output:
+                os.makedirs(os.path.dirname(self.output), exist_ok=True)
+                with open(self.output, 'ab') as out:
+                    result = subprocess.Popen(self.proc.argv, cwd=self.cwd, stdin=subprocess.DEVNULL,
+                                              stdout=out, stderr=subprocess.STDOUT)
+            elif result is None: result = subprocess.Popen(self.proc.argv, cwd=self.cwd)
+        except Exception as e:
+            result = e
+        try: self.supervisor.spawned.emit(self.proc, result)
+        except RuntimeError: pass # the window was destroyed while this spawn ran (quit)
+
+class ProcessSupervisor(QObject):
+    # Owns every program started from a tile. Spawns run on a private worker pool, exits are
+    # noticed through a pidfd per child (a QSocketNotifier, so no SIGCHLD handler and no
+    # zombies) and reaped there, with a once-a-second poll where pidfd_open is unavailable.
+    # Tiles read their state ('running', 'failed' or None) from here when they paint.
+    spawned = pyqtSignal(object, object)   # worker -> GUI thread: (run, Popen or exception)
+    state_changed = pyqtSignal(object)     # Tile
+    launch_failed = pyqtSignal(object)     # ProcessRun that did not start or exited at once
+    spawn_done = pyqtSignal(object)        # ProcessRun once its spawn succeeded or failed
+    QUICK_EXIT = 5.0 # seconds; a failing exit sooner than this counts as a failed launch
+    HISTORY = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self.running = {}   # Tile -> [ProcessRun]
+        self.last = {}      # Tile -> last finished ProcessRun
+        self.history = []   # finished runs, oldest first
+        self.polled = []    # runs without a pidfd
+        self.default_mode = 'auto' # Settings.launch_mode
+        self.latency = {}   # backend -> recent launch latencies in ms
+        self.fast_start = {} # python_path -> ForkServer
+        self.retired = []   # Popen of stopped forkservers, reaped by poll()
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(1000)
+        self.poll_timer.timeout.connect(self.poll)
+        self.spawned.connect(self.on_spawned)
+        default_terminal() # detected once, before the first click
+
+    def state(self, tile):
+        if tile in self.running: return 'running'
+        last = self.last.get(tile)
+        return 'failed' if last is not None and last.failed else None
+
+    def last_run(self, tile):
+        runs = self.running.get(tile)
+        return runs[-1] if runs else self.last.get(tile)
+
+    def launch(self, tile):
+        mode = launch_mode(tile, self.default_mode)
+        try: argv, cwd, required, output = tile_command(tile, mode)
+        except ValueError as e:
+            proc = ProcessRun(tile, [], mode)
+            proc.error = str(e)
+            self.finish(proc)
+            return proc
+        # Fast start covers scripts of a warm interpreter unless the tile picks its own backend
+        server = self.fast_server(tile.python_path) if required and not tile.launch_mode else None
+        proc = ProcessRun(tile, argv, 'fast start' if server is not None else mode)
+        self.running.setdefault(tile, []).append(proc)
+        self.pool.start(SpawnTask(self, proc, cwd, required, output, server))
+        self.state_changed.emit(tile)
+        return proc
+
+    def on_spawned(self, proc, result):
+        self.watch(proc, result)
+        self.spawn_done.emit(proc)
+
+    def watch(self, proc, result):
+        if isinstance(result, BaseException):
+            proc.error = str(result)
+            self.finish(proc)
+            return
+        proc.popen = result
+        if isinstance(result, FastStartProcess):
+            # The forkserver reaps the script; its channel reports pid, __main__ and exit code
+            fd = result.fileno()
+        else:
+            self.record_latency(proc, proc.runtime() * 1000, "started")
+            try:
+                fd = proc.pidfd = os.pidfd_open(result.pid)
+            except (AttributeError, OSError):
+                self.polled.append(proc)
+                if not self.poll_timer.isActive(): self.poll_timer.start()
+                return
+        # Readable once the child has exited; an already exited child is still a zombie here
+        proc.notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+        proc.notifier.activated.connect(lambda *_, proc=proc: self.reap(proc))
+
+    def reap(self, proc):
+        code = proc.popen.poll()
+        if proc.main_ms is None and getattr(proc.popen, 'main_at', None) is not None:
+            proc.main_ms = (proc.popen.main_at - proc.started) * 1000
+            self.record_latency(proc, proc.main_ms, "reached __main__")
+        if code is None: return
+        if proc.notifier is not None:
+            proc.notifier.setEnabled(False)
+            proc.notifier.deleteLater()
+            proc.notifier = None
+        if proc.pidfd is not None:
+            os.close(proc.pidfd)
+            proc.pidfd = None
+        if isinstance(proc.popen, FastStartProcess):
+            proc.popen.close()
+            if proc.popen.lost():
+                # The forkserver died before it took the request: the script never ran
+                self.fall_back(proc, "forkserver exited")
+                return
+        proc.returncode = code
+        self.finish(proc)
+
+    def fall_back(self, proc, why):
+        # Run a fast start tile again through its normal backend
+        proc.backend = launch_mode(proc.tile, self.default_mode)
+        proc.popen = None
+        log.warning("fast start failed for %s (%s), using %s", proc.tile.script_path, why, proc.backend)
+        try: _, cwd, required, output = tile_command(proc.tile, proc.backend)
+        except ValueError as e:
+            proc.error = str(e)
+            self.finish(proc)
+            return
+        self.pool.start(SpawnTask(self, proc, cwd, required, output))
+
+    def poll(self):
+        for proc in list(self.polled):
+            if proc.popen.poll() is not None:
+                self.polled.remove(proc)
+                self.reap(proc)
+        self.retired = [p for p in self.retired if p.poll() is None]
+        if not self.polled and not self.retired: self.poll_timer.stop()
+
+    def record_latency(self, proc, ms, what):
+        # Per backend: click until the process exists (fast start: until the script's __main__)
+        samples = self.latency.setdefault(proc.backend, [])
+        samples.append(ms)
+        del samples[:-50]
+        log.info("%s: %s via %s in %.1f ms (median %.1f ms over %d)", proc.tile.name or proc.argv[0], what,
+                 proc.backend, ms, sorted(samples)[len(samples) // 2], len(samples))
+
+    def latency_summary(self):
+        return ", ".join(f"{backend} {sorted(samples)[len(samples) // 2]:.1f} ms ({len(samples)})"
+                         for backend, samples in sorted(self.latency.items()))
+
+    def configure_fast_start(self, mapping):
+        # Start and stop forkservers to match Settings.fast_start
+        for python, server in list(self.fast_start.items()):
+            modules = mapping.get(python)
+            if modules is None or tuple(modules) != server.modules: self.retire_server(python)
+        for python, modules in mapping.items():
+            if python not in self.fast_start: self.start_server(python, modules)
+
+    def start_server(self, python, modules):
+        try: server = self.fast_start[python] = ForkServer(python, modules)
+        except OSError as e:
+            log.warning("fast start for %s unavailable: %s", python, e)
+            return None
+        log.info("fast start: warm %s preloading %s", python, ", ".join(modules) or "nothing")
+        return server
+
+    def retire_server(self, python):
+        server = self.fast_start.pop(python)
+        server.close()
+        self.retired.append(server.popen)
+        if not self.poll_timer.isActive(): self.poll_timer.start()
+
+    def fast_server(self, python):
+        # The warm server for python if it is ready to take a request, else None
+        server = self.fast_start.get(python)
+        if server is None: return None
+        if server.check_ready():
+            if server.alive(): return server
+            log.warning("fast start server for %s exited (code %s), restarting", python, server.popen.returncode)
+            self.retire_server(python)
+            self.start_server(python, server.modules)
+        elif not server.alive() and not server.failed:
+            # A preload crashed the interpreter, or it is too old; restarting would fail the same way
+            server.failed = True
+            log.warning("fast start server for %s exited before it was ready (code %s); not restarting",
+                        python, server.popen.returncode)
+        return None
+
+    def output_log(self, tile):
+        # Output log of a fast start, headless or direct run of this tile, if it has one
+        if not tile.script_path: return None
+        path = run_log_path(tile.script_path)
+        return path if os.path.exists(path) else None
+
+    def finish(self, proc):
+        proc.ended = time.monotonic()
+        runs = self.running.get(proc.tile)
+        if runs and proc in runs:
+            runs.remove(proc)
+            if not runs: del self.running[proc.tile]
+        self.last[proc.tile] = proc
+        self.history.append(proc)
+        del self.history[:-self.HISTORY]
+        name = proc.tile.name or (proc.argv[0] if proc.argv else "?")
+        if proc.failed:
+            log.warning("%s: %s", name, proc.describe())
+            if proc.error is not None or proc.runtime() < self.QUICK_EXIT: self.launch_failed.emit(proc)
+        else:
+            log.info("%s: %s", name, proc.describe())
+        self.state_changed.emit(proc.tile)
+
+# --- SINGLE INSTANCE ---
+class InstanceServer(QObject):
+    # Local socket the first launcher listens on. Later invocations hand their command to it
+    # (see send_command) instead of starting a second tray icon and hotkey listener.
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.handler = None # handler(cmd, arg, respond) -> reply line, or None to call respond(reply) later
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self.accept)
+
+    def listen(self):
+        if self.server.listen(self.path): return True
+        # A socket file nobody answers on is left over from a crash
+        try: connect_instance(0.5).close()
+        except OSError:
+            QLocalServer.removeServer(self.path)
+            return self.server.listen(self.path)
+        return False
+
+    def accept(self):
+        while self.server.hasPendingConnections():
+            conn = self.server.nextPendingConnection()
+            conn.readyRead.connect(lambda conn=conn: self.read(conn))
+            conn.disconnected.connect(conn.deleteLater)
+            self.read(conn)
+
+    def read(self, conn):
+        if not conn.canReadLine(): return
+        line = bytes(conn.readLine()).decode(errors='replace').strip()
+        cmd, _, arg = line.partition(" ")
+        start = time.perf_counter()
+        respond = lambda reply: self.respond(conn, line, reply, start)
+        try:
+            reply = self.handler(cmd, arg.strip(), respond) if self.handler else "error: starting up"
+        except Exception as e:
+            log.exception("command %r failed", line)
+            reply = f"error: {e}"
+        if reply is not None: respond(reply)
+
+    def respond(self, conn, line, reply, start):
+        log.debug("command %r -> %s in %.1f ms", line, reply, (time.perf_counter() - start) * 1000)
+        try:
+            conn.write((reply + "\n").encode())
+            conn.flush()
+            conn.disconnectFromServer()
+        except RuntimeError: pass # the client hung up while a deferred reply was pending
+
+# --- MAIN WINDOW: Background & Warm Show ---
+class BackgroundWidget(QWidget):
+    # Central widget. An image background is decoded straight to the window size once and
+    # blitted on every paint; the border-image stylesheet it replaces rescaled the source image
+    # on each repaint. Color backgrounds stay a stylesheet, which the children inherit.
+    painted = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground) # paint the stylesheet color
+        self.image_path = None
+        self.pixmap = None
+        self.pixmap_key = None
+
+    def set_image(self, path):
+        self.image_path = path
+        self.pixmap = None
+        self.pixmap_key = None
+        self.update()
+
+    def scaled_pixmap(self):
+        if not self.image_path: return None
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if key != self.pixmap_key:
+            reader = QImageReader(self.image_path)
+            reader.setAutoTransform(True)
+            reader.setScaledSize(QSize(round(self.width() * dpr), round(self.height() * dpr)))
+            image = reader.read()
+            self.pixmap = QPixmap.fromImage(image) if not image.isNull() else None
+            if self.pixmap is not None: self.pixmap.setDevicePixelRatio(dpr)
+            self.pixmap_key = key
+        return self.pixmap
+
+    def paintEvent(self, event):
+        pixmap = self.scaled_pixmap()
+        if pixmap is not None: QPainter(self).drawPixmap(0, 0, pixmap)
+        self.painted.emit()
+
+class PrerenderOverlay(QWidget):
+    # Covers the window with a snapshot of the start screen for the first frame after a show,
+    # so that frame is a single blit instead of a paint of the background and every tile.
+    # The live widgets take over on the next turn of the event loop, painting the same picture.
+    painted = pyqtSignal()
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.pixmap = None
+        self.hide()
+
+    def paintEvent(self, event):
+        if self.pixmap is not None: QPainter(self).drawPixmap(0, 0, self.pixmap)
+        self.painted.emit()
 
 # --- MAIN WINDOW ---
+PRERENDER_DELAY_MS = 400 # after a hide or a change, longer than TileAnimator.DURATION
+
 class LauncherWindow(QMainWindow):
+    hotkey_pressed = pyqtSignal() # emitted from the pynput thread, delivered on the GUI thread
+
     def __init__(self):
         super().__init__()
         self.config_file = 'config.json'
+        self.config_writer = ConfigWriter(self.config_file)
+        self.config_store = None
         self.is_edit_mode = False
+        self.tile_pool = TilePool(self)
+        self.animator = TileAnimator(self)
+        self.hotkey_listener = None
+        self.hotkey_pressed.connect(self.toggle_visibility)
+        # Snapshot of the start screen taken while hidden (see show_prerendered)
+        self.prerender = None
+        self.prerender_timer = QTimer(self)
+        self.prerender_timer.setSingleShot(True)
+        self.prerender_timer.setInterval(PRERENDER_DELAY_MS)
+        self.prerender_timer.timeout.connect(self.update_prerender)
+        self.show_started = time.perf_counter() # startup counts as the first show
+        self.last_show_ms = None
+        self.supervisor = ProcessSupervisor(self)
+        self.supervisor.state_changed.connect(self.tile_run_state_changed)
+        self.supervisor.launch_failed.connect(self.report_launch_failure)
         
         self.load_config()
         self.init_ui()
         self.setup_tray()
-        self.setup_shortcuts()
         
         self.floating_btn = FloatingStartButton(self)
         self.floating_btn.hide()
         
+        # Installed applications, kept current by a directory watcher for the importer
+        self.app_catalog = AppCatalog(self)
+        self.app_catalog.start()
+        
         # Debounce timer for saving
         self.save_timer = QTimer(self)
         self.save_timer.setSingleShot(True)
         self.save_timer.timeout.connect(self._save_to_disk)
 
+    def store_path(self):
+        return os.path.splitext(self.config_file)[0] + ".db"
+
     def load_config(self):
-        if os.path.exists(self.config_file):
-            with open(self.config_file, 'r') as f:
-                self.config = json.load(f)
-        else:
-            self.config = {"settings": {}, "groups": [{"name": "Start", "apps": []}], "recent_themes": []}
+        self.config = None
+        if os.path.exists(self.store_path()):
+            self.config_store = ConfigStore(self.store_path())
+            if not self.config_store.is_empty():
+                self.config = self.config_store.load()
+        for path in ([] if self.config is not None else self.config_writer.candidates()):
+            if not os.path.exists(path): continue
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                if not isinstance(data, dict): raise ValueError("not a config document")
+                self.config = Config.from_dict(data)
+            except (OSError, ValueError) as e:
+                log.warning("could not read %s: %s", path, e)
+                continue
+            if path != self.config_writer.path: log.warning("restored config from backup %s", path)
+            break
+        if self.config is None:
+            self.config = Config(groups=[Group(name="Start")])
         
-        if "groups" not in self.config: self.config["groups"] = []
-        if "recent_themes" not in self.config: self.config["recent_themes"] = []
-        if "settings" not in self.config: self.config["settings"] = {}
-
-    def save_config(self):
-        # Trigger debounce save
+        if self.config.settings.storage == 'sqlite' or self.config_store is not None:
+            self.set_storage('sqlite')
+        self.apply_runtime_settings()
+
+    def apply_runtime_settings(self):
+        # Settings that act on shared objects rather than on the widgets refresh_ui rebuilds
+        mb = self.config.settings.icon_cache_mb
+        ICON_CACHE.set_budget(mb * 1024 * 1024)
+        self.animator.reduced_motion = self.config.settings.reduced_motion
+        self.setup_shortcuts()
+        self.supervisor.default_mode = self.config.settings.launch_mode
+        self.supervisor.configure_fast_start(self.config.settings.fast_start)
+        log.debug("icon cache: %s", ICON_CACHE.stats())
+
+    def save_config(self, *changed):
+        # Trigger debounce save. changed: the Tiles and Groups edited, or the Config when groups
+        # were added, removed or reordered (what the SQLite store has to look at; see ConfigStore.mark)
+        if self.config_store is not None: self.config_store.mark(*changed)
         self.save_timer.start(2000) 
 
+    def save_tile(self, app_data):
+        # One edited tile: a single-row update with the SQLite store, a debounced save otherwise
+        if self.config_store is not None and self.config_store.update_app(app_data): return
+        self.save_config(app_data)
+
+    def set_storage(self, mode):
+        # Switch between config.json and the SQLite store, carrying the current config across
+        self.config.settings.storage = mode
+        if mode == 'sqlite':
+            if self.config_store is None: self.config_store = ConfigStore(self.store_path())
+            self.config_store.sync(self.config)
+        elif self.config_store is not None:
+            self.export_config_json()
+            self.config_store.close()
+            self.config_store = None
+            os.replace(self.store_path(), self.store_path() + ".bak")
+
+    def export_config_json(self, timeout=3.0):
+        self.config_writer.submit(self.config)
+        return self.config_writer.flush(timeout)
+
     def _save_to_disk(self):
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=4)
+        self.save_timer.stop()
+        if self.config_store is not None: self.config_store.sync(self.config)
+        else: self.config_writer.submit(self.config)
 
-    def closeEvent(self, event):
+    def flush_config(self):
         self._save_to_disk()
+        if not self.config_writer.flush(timeout=3.0):
+            log.warning("config save still running after 3 s; closing anyway")
+
+    def closeEvent(self, event):
+        self.flush_config()
         event.accept()
 
+    def event(self, event):
+        # Moving to a screen with another scale factor: re-render tiles at the new ratio (Qt 6.6+)
+        if event.type() == getattr(QEvent.Type, 'DevicePixelRatioChange', None): self.refresh_ui()
+        return super().event(event)
+
+    def apply_theme(self, data):
+        # Merge a theme document ({"settings": ..., "start_btn": ...}) into the current config
+        self.config.settings = self.config.settings.with_theme(data.get('settings'))
+        start_btn = data.get('start_btn')
+        if isinstance(start_btn, dict):
+            self.config.start_btn = replace(self.config.start_btn,
+                                            **{k: v for k, v in start_btn.items() if k in StartButtonSettings.FIELDS})
+        self.apply_runtime_settings()
+        self.save_config()
+        self.apply_background()
+        self.refresh_ui()
+        self.floating_btn.apply_settings()
+
     def add_recent_theme(self, name, settings_dict):
-        recents = self.config.get('recent_themes', [])
-        recents = [t for t in recents if t['name'] != name]
+        recents = [t for t in self.config.recent_themes if t['name'] != name]
         recents.insert(0, {"name": name, "settings": settings_dict})
-        self.config['recent_themes'] = recents[:3]
+        self.config.recent_themes = recents[:3]
         self._save_to_disk()
 
     def setup_shortcuts(self):
+        # Global Super+P through pynput, which is optional: a window manager keybinding
+        # running `Lumex8.py toggle` does the same job
+        enabled = self.config.settings.global_hotkey
+        if (self.hotkey_listener is not None) == enabled: return
+        if not enabled:
+            self.hotkey_listener.stop()
+            self.hotkey_listener = None
+            return
         try:
-            self.hotkey_listener = keyboard.GlobalHotKeys({'<cmd>+p': self.toggle_visibility})
+            from pynput import keyboard
+        except ImportError:
+            log.info("pynput is not installed; bind `%s toggle` to a key instead", sys.argv[0])
+            return
+        try:
+            # pynput calls back on its own thread; the signal hands the toggle to the GUI thread
+            self.hotkey_listener = keyboard.GlobalHotKeys({'<cmd>+p': self.hotkey_pressed.emit})
             self.hotkey_listener.start()
-        except: pass
+        except Exception as e:
+            log.warning("global hotkey unavailable: %s", e)
+            self.hotkey_listener = None
 
     def setup_tray(self):
         self.tray_icon = QSystemTrayIcon(self)
@@ -1400,21 +4139,126 @@ class LauncherWindow(QMainWindow):
         self.tray_icon.show()
         self.tray_icon.activated.connect(lambda r: self.toggle_visibility() if r == QSystemTrayIcon.ActivationReason.Trigger else None)
 
+    def run_command(self, cmd, arg="", respond=None):
+        # Commands from later invocations (see InstanceServer); returns the reply line, or None
+        # when respond(reply) follows once the outcome is known
+        if cmd == 'toggle': self.toggle_visibility()
+        elif cmd == 'show':
+            if not self.isVisible(): self.toggle_visibility()
+            else: self.activateWindow()
+        elif cmd == 'hide':
+            if self.isVisible(): self.toggle_visibility()
+        elif cmd == 'launch':
+            app_data = self.find_tile(arg)
+            if app_data is None: return f"error: no tile named {arg!r}"
+            if app_data.type == 'desktop':
+                self.toggle_visibility()
+                return "ok"
+            run = self.supervisor.launch(app_data)
+            if self.isVisible(): self.toggle_visibility()
+            if run.error is not None: return "error: " + run.describe()
+            if respond is not None:
+                # Answer once the spawn worker reports, so a missing script or failed exec is an error
+                def spawned(proc):
+                    if proc is not run: return
+                    self.supervisor.spawn_done.disconnect(spawned)
+                    respond("ok" if proc.error is None else "error: " + proc.describe().replace("\n", " "))
+                self.supervisor.spawn_done.connect(spawned)
+                return None
+        elif cmd == 'reload': self.reload_config()
+        elif cmd == 'quit': QTimer.singleShot(0, QApplication.instance().quit)
+        else: return f"error: unknown command {cmd!r} (expected one of {', '.join(COMMANDS)})"
+        return "ok"
+
+    def tile_run_state_changed(self, app_data):
+        for slot in self.group_slots:
+            if isinstance(slot, GroupWidget): slot.tile_changed(app_data)
+        self.invalidate_prerender()
+
+    def report_launch_failure(self, run):
+        # Non-blocking: the window is usually hidden by the time a launch fails
+        self.tray_icon.showMessage(run.tile.name or "Lumex8", run.describe().capitalize(),
+                                   QSystemTrayIcon.MessageIcon.Warning, 5000)
+
+    def find_tile(self, name):
+        name = name.casefold()
+        return next((app for group in self.config.groups for app in group.apps if app.name.casefold() == name), None)
+
+    def reload_config(self):
+        # Take config.json / config.db as they are on disk now, e.g. after editing by hand
+        self.save_timer.stop()
+        self.config_writer.flush(timeout=3.0)
+        if self.config_store is not None:
+            self.config_store.close()
+            self.config_store = None
+        self.load_config()
+        self.apply_background()
+        self.refresh_ui()
+        self.floating_btn.apply_settings()
+
     def toggle_visibility(self):
         if self.isVisible(): 
+            if self.overlay.isVisible(): self.end_prerendered()
             self.hide()
             self.floating_btn.apply_settings()
+            # Snapshot the screen once hover animations have settled
+            self.invalidate_prerender()
         else: 
+            self.show_started = time.perf_counter()
+            self.show_prerendered()
             self.showFullScreen()
             self.activateWindow()
             self.floating_btn.hide()
 
+    # --- warm show ---
+    def invalidate_prerender(self):
+        # Anything that changes the start screen; a hidden window takes a new snapshot when idle
+        self.prerender = None
+        if not self.isVisible(): self.prerender_timer.start()
+
+    def update_prerender(self):
+        if self.isVisible(): return
+        start = time.perf_counter()
+        self.prerender = self.grab()
+        log.debug("start screen prerendered in %.1f ms", (time.perf_counter() - start) * 1000)
+
+    def show_prerendered(self):
+        pixmap, self.prerender = self.prerender, None
+        if pixmap is None or pixmap.deviceIndependentSize().toSize() != self.size(): return False
+        # The live widgets stay unpainted under the overlay until the first frame is out
+        self.central_container.setUpdatesEnabled(False)
+        self.overlay.pixmap = pixmap
+        self.overlay.setGeometry(self.rect())
+        self.overlay.raise_()
+        self.overlay.show()
+        return True
+
+    def end_prerendered(self):
+        self.overlay.hide()
+        self.overlay.pixmap = None
+        self.central_container.setUpdatesEnabled(True)
+
+    def frame_painted(self):
+        # Called at the end of a frame's root paint; the frame is on screen by the next loop turn
+        if self.show_started is None: return
+        started, self.show_started = self.show_started, None
+        QTimer.singleShot(0, lambda: self.first_frame_shown(started))
+
+    def first_frame_shown(self, started):
+        self.last_show_ms = (time.perf_counter() - started) * 1000
+        warm = self.overlay.isVisible()
+        log.info("start screen shown in %.1f ms (%s)", self.last_show_ms, "prerendered" if warm else "full paint")
+        if warm: self.end_prerendered()
+
     def init_ui(self):
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
         self.showFullScreen()
         
-        self.central_container = QWidget()
+        self.central_container = BackgroundWidget()
+        self.central_container.painted.connect(self.frame_painted)
         self.setCentralWidget(self.central_container)
+        self.overlay = PrerenderOverlay(self)
+        self.overlay.painted.connect(self.frame_painted)
         self.apply_background()
         
         layout = QVBoxLayout(self.central_container)
@@ -1461,7 +4305,11 @@ class LauncherWindow(QMainWindow):
         self.groups_layout = QHBoxLayout(self.groups_container)
         self.groups_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
         self.groups_layout.setSpacing(0)
+        self.groups_layout.addStretch()
+        self.group_slots = []
         self.scroll_area.setWidget(self.groups_container)
+        self.scroll_area.horizontalScrollBar().valueChanged.connect(lambda _: self.update_visible_groups())
+        self.scroll_area.viewport().installEventFilter(self)
         layout.addWidget(self.scroll_area)
         
         self.refresh_ui()
@@ -1478,33 +4326,110 @@ class LauncherWindow(QMainWindow):
         btn.setStyleSheet("QPushButton { background-color: rgba(0, 0, 0, 0.5); color: white; border: 1px solid rgba(255,255,255,0.3); font-size: 14px; border-radius: 5px; padding: 5px; } QPushButton:hover { background-color: rgba(255, 255, 255, 0.2); } QPushButton:checked { background-color: #e51400; border: none; }")
 
     def apply_background(self):
-        settings = self.config.get('settings', {})
-        bg_type = settings.get('background_type', 'color')
-        if bg_type == 'image':
-            path = settings.get('background_value', '').replace('\\', '/')
-            if os.path.exists(path):
-                self.central_container.setObjectName("BG")
-                # FIX: Use border-image instead of background-size
-                self.central_container.setStyleSheet(f"#BG {{ border-image: url({path}) 0 0 0 0 stretch stretch; }}")
-                return
-        color = settings.get('background_color', '#1d1d1d')
-        self.central_container.setStyleSheet(f"background-color: {color};")
+        settings = self.config.settings
+        path = settings.background_value.replace('\\', '/') if settings.background_type == 'image' else ''
+        if path and os.path.exists(path):
+            self.central_container.setStyleSheet("")
+            self.central_container.set_image(path)
+        else:
+            self.central_container.set_image(None)
+            self.central_container.setStyleSheet(f"background-color: {settings.background_color};")
+        self.invalidate_prerender()
 
     def refresh_ui(self):
-        # OPTIMIZATION: Disable updates during rebuild
+        # Reconcile existing group/tile widgets with config.groups instead of rebuilding.
+        # Groups and tiles are matched by the identity of their config dicts. Each group
+        # occupies a slot that is either a GroupWidget or a GroupPlaceholder.
         self.setUpdatesEnabled(False)
         
-        while self.groups_layout.count():
-            item = self.groups_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-
-        groups = self.config.get('groups', [])
+        groups = self.config.groups
+        width = group_width(self.config.settings)
+        existing = {id(s.group_data): s for s in self.group_slots}
+        group_cls = self.group_class()
+        slots = []
+        spare_tiles = {}
         for i, grp_data in enumerate(groups):
-            grp_widget = GroupWidget(self, grp_data, i)
-            self.groups_layout.addWidget(grp_widget)
-        self.groups_layout.addStretch()
+            s = existing.pop(id(grp_data), None)
+            if s is None: s = GroupPlaceholder(grp_data, i, width)
+            elif isinstance(s, GroupWidget) and type(s) is not group_cls:
+                # Render mode changed: rebuild this group with the other renderer
+                spare_tiles.update(s.take_tiles())
+                placeholder = GroupPlaceholder(grp_data, i, width)
+                self.groups_layout.replaceWidget(s, placeholder)
+                s.hide()
+                s.deleteLater()
+                s = placeholder
+            slots.append(s)
+        
+        # Tiles of removed groups may have been dragged elsewhere; offer them for reuse
+        for s in existing.values():
+            if isinstance(s, GroupWidget): spare_tiles.update(s.take_tiles())
+            self.groups_layout.removeWidget(s)
+            s.hide()
+            s.deleteLater()
+        for s in slots:
+            if isinstance(s, GroupWidget): s.release_moved_tiles(spare_tiles)
+        
+        for i, s in enumerate(slots):
+            s.sync(i, spare_tiles if isinstance(s, GroupWidget) else width)
+            if self.groups_layout.indexOf(s) != i:
+                self.groups_layout.insertWidget(i, s)
+        self.group_slots = slots
+        self.update_visible_groups(spare_tiles)
+        
+        for tile in spare_tiles.values():
+            self.tile_pool.release(tile)
         
         self.setUpdatesEnabled(True)
+        self.invalidate_prerender()
+        log.debug("tile pool: %s", self.tile_pool.stats())
+
+    def update_visible_groups(self, spare_tiles=None):
+        # Only groups inside the viewport (plus one group of margin) are real widgets;
+        # groups further than a viewport away are turned back into placeholders.
+        if not self.group_slots: return
+        width = group_width(self.config.settings)
+        left = self.scroll_area.horizontalScrollBar().value()
+        view_w = max(self.scroll_area.viewport().width(), width)
+        x0 = self.groups_layout.contentsMargins().left()
+        near = (left - width, left + view_w + width)
+        far = (left - view_w, left + 2 * view_w)
+        
+        # refresh_ui calls this with updates already off; only pause (and resume) them ourselves
+        pause = self.updatesEnabled()
+        changed = False
+        for i, s in enumerate(self.group_slots):
+            x = x0 + i * width
+            if isinstance(s, GroupPlaceholder):
+                if x + width <= near[0] or x >= near[1]: continue
+                if pause and not changed: self.setUpdatesEnabled(False)
+                changed = True
+                w = self.group_class()(self, s.group_data, i)
+                w.sync(i, spare_tiles if spare_tiles is not None else {})
+                self.replace_slot(i, s, w)
+            elif x + width < far[0] or x > far[1]:
+                if pause and not changed: self.setUpdatesEnabled(False)
+                changed = True
+                for tile in s.take_tiles().values():
+                    self.tile_pool.release(tile)
+                self.replace_slot(i, s, GroupPlaceholder(s.group_data, i, width))
+        if pause and changed: self.setUpdatesEnabled(True)
+
+    def group_class(self):
+        if self.config.settings.render_mode == 'canvas':
+            return CanvasGroupWidget
+        return GroupWidget
+
+    def replace_slot(self, i, old, new):
+        self.groups_layout.replaceWidget(old, new)
+        self.group_slots[i] = new
+        old.hide()
+        old.deleteLater()
+
+    def eventFilter(self, obj, event):
+        if obj is self.scroll_area.viewport() and event.type() == QEvent.Type.Resize:
+            self.update_visible_groups()
+        return super().eventFilter(obj, event)
 
     def toggle_edit_mode(self):
         self.is_edit_mode = self.edit_btn.isChecked()
@@ -1523,22 +4448,22 @@ class LauncherWindow(QMainWindow):
         if dlg.exec():
             name = dlg.textValue()
             if name:
-                self.config['groups'].append({"name": name, "apps": []})
-                self.save_config()
+                self.config.groups.append(Group(name=name))
+                self.save_config(self.config)
                 self.refresh_ui()
 
     def delete_group(self, index):
-        del self.config['groups'][index]
-        self.save_config()
+        del self.config.groups[index]
+        self.save_config(self.config)
         self.refresh_ui()
 
     def add_new_item(self, group_index):
         dlg = AppEditorDialog(self, self)
         if dlg.exec():
             new_data = dlg.get_data()
-            if new_data['name']:
-                self.config['groups'][group_index]['apps'].append(new_data)
-                self.save_config()
+            if new_data.name:
+                self.config.groups[group_index].apps.append(new_data)
+                self.save_config(self.config.groups[group_index])
                 self.refresh_ui()
 
     def delete_item(self, group_index, item_index):
@@ -1548,13 +4473,13 @@ class LauncherWindow(QMainWindow):
         msg.setText("Remove item?")
         msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if msg.exec() == QMessageBox.StandardButton.Yes:
-            del self.config['groups'][group_index]['apps'][item_index]
-            self.save_config()
+            del self.config.groups[group_index].apps[item_index]
+            self.save_config(self.config.groups[group_index])
             self.refresh_ui()
 
     def handle_drop(self, src_grp, src_idx, dst_grp, dst_idx):
         def get_list(grp_idx):
-            return self.config['groups'][grp_idx]['apps']
+            return self.config.groups[grp_idx].apps
         src_list = get_list(src_grp)
         dst_list = get_list(dst_grp)
         item = src_list.pop(src_idx)
@@ -1568,12 +4493,35 @@ class LauncherWindow(QMainWindow):
         else:
             dst_list.insert(dst_idx, item)
             
-        self.refresh_ui() # Save config deferred to closeEvent/timer
+        self.save_config(self.config.groups[src_grp], self.config.groups[dst_grp])
+        self.refresh_ui()
 
 if __name__ == "__main__":
+    level = os.environ.get("LUMEX8_LOG", "WARNING").upper()
+    known = isinstance(logging.getLevelName(level), int)
+    logging.basicConfig(level=level if known else "WARNING", format="%(asctime)s %(name)s %(levelname)s: %(message)s")
+    if not known: log.warning("LUMEX8_LOG=%s is not a log level (DEBUG, INFO, WARNING, ERROR); using WARNING", level)
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
+    words = command_from_argv(sys.argv)
+    path = instance_socket_path(create=True)
+    server = InstanceServer(path) if path else None
+    if server is None:
+        log.warning("/tmp/lumex8-%d is not a private directory; running without the command socket", os.getuid())
+    elif not server.listen():
+        # Another launcher got there first
+        reply = send_command(words) or f"error: {server.server.errorString()}"
+        if reply != "ok": print(reply, file=sys.stderr)
+        sys.exit(0 if reply == "ok" else 1)
     font = QFont("Segoe UI", 10)
     app.setFont(font)
     window = LauncherWindow()
+    if server is not None: server.handler = window.run_command
+    # Tray "Quit" and the quit command end the event loop without closing the window
+    app.aboutToQuit.connect(window.flush_config)
+    # The window starts shown, so only these mean anything on a fresh start
+    if words[0] in ('hide', 'launch'):
+        report = lambda reply: reply == "ok" or print(reply, file=sys.stderr)
+        reply = window.run_command(words[0], " ".join(words[1:]), report)
+        if reply is not None: report(reply)
     sys.exit(app.exec())
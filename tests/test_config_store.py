@@ -0,0 +1,131 @@
+import json
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+pytest.importorskip("PyQt6")
+from Lumex8 import Config, ConfigStore, Group, Tile
+
+order_keys = ConfigStore.order_keys
+
+
+def stored(path):
+    store = ConfigStore(path)
+    try: return store.load().to_dict()
+    finally: store.close()
+
+
+def test_order_keys_empty_and_new_lists():
+    assert order_keys([]) == []
+    assert order_keys([None, None, None]) == [1.0, 2.0, 3.0]
+
+
+def test_order_keys_keep_the_longest_run_and_fill_the_gaps():
+    assert order_keys([1.0, 2.0, 3.0]) == [1.0, 2.0, 3.0]
+    # The tile with key 3.0 moved to the front: only its key changes
+    keys = order_keys([3.0, 1.0, 2.0])
+    assert keys[1:] == [1.0, 2.0] and keys[0] < 1.0
+    keys = order_keys([1.0, None, 2.0, None])
+    assert keys[0] == 1.0 and keys[2] == 2.0
+    assert keys[0] < keys[1] < keys[2] < keys[3]
+
+
+def test_order_keys_run_out_of_precision():
+    # No float fits between two adjacent keys: the caller renumbers the whole group
+    lo = 1.0
+    hi = lo + sys.float_info.epsilon
+    assert order_keys([lo, None, hi]) is None
+    assert order_keys([lo, None, None, lo + 2 * sys.float_info.epsilon]) is None
+
+
+def run_ops(path, seed, steps=600):
+    # Random edits marked the way LauncherWindow marks them; the store must always reload to the live config
+    rng = random.Random(seed)
+    config = Config(groups=[Group(name=f"G{g}", apps=[Tile(name=f"T{g}-{i}") for i in range(rng.randint(0, 8))])
+                            for g in range(4)])
+    store = ConfigStore(path)
+    store.sync(config)
+    n = 0
+    for step in range(steps):
+        op = rng.random()
+        groups = config.groups
+        if op < 0.35 and groups:
+            a, b = rng.choice(groups), rng.choice(groups)
+            if a.apps:
+                b.apps.insert(rng.randint(0, len(b.apps)), a.apps.pop(rng.randrange(len(a.apps))))
+                store.mark(a, b)
+        elif op < 0.45 and groups:
+            group = rng.choice(groups)
+            if group.apps:
+                del group.apps[rng.randrange(len(group.apps))]
+                store.mark(group)
+        elif op < 0.55 and groups:
+            n += 1
+            group = rng.choice(groups)
+            group.apps.insert(rng.randint(0, len(group.apps)), Tile(name=f"N{n}"))
+            store.mark(group)
+        elif op < 0.62:
+            n += 1
+            groups.insert(rng.randint(0, len(groups)), Group(name=f"NG{n}", apps=[Tile(name=f"NGT{n}")]))
+            store.mark(config)
+        elif op < 0.67 and len(groups) > 1:
+            # Move a tile out of a group, then delete the group (deletes run after the tile pass)
+            gone = groups.pop(rng.randrange(len(groups)))
+            if gone.apps:
+                target = rng.choice(groups)
+                target.apps.append(gone.apps[0])
+                store.mark(target)
+            store.mark(config)
+        elif op < 0.75 and groups:
+            group = rng.choice(groups)
+            if group.apps:
+                tile = rng.choice(group.apps)
+                tile.color = f"#{rng.randrange(16 ** 6):06x}"
+                # LauncherWindow.save_tile: a tile not synced yet falls back to mark()
+                if rng.random() < 0.5 or not store.update_app(tile): store.mark(tile)
+        elif op < 0.8 and groups:
+            group = rng.choice(groups)
+            group.name = f"R{step}"
+            store.mark(group)
+        elif op < 0.85:
+            rng.shuffle(groups)
+            store.mark(config)
+        elif op < 0.92 and groups:
+            # Repeated moves to the same spot use up the gap between two keys
+            group = rng.choice(groups)
+            if len(group.apps) > 2:
+                for _ in range(60):
+                    group.apps.insert(1, group.apps.pop())
+                    store.mark(group)
+                    store.sync(config)
+        if rng.random() < 0.2:
+            store.sync(config)
+            assert stored(path) == json.loads(json.dumps(config.to_dict()))
+    store.sync(config)
+    store.close()
+    assert stored(path) == json.loads(json.dumps(config.to_dict()))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_edits_round_trip(tmp_path, seed):
+    run_ops(str(tmp_path / "config.db"), seed)
+
+
+def test_edits_after_reload_round_trip(tmp_path):
+    # load() rebuilds the row caches; edits after it must land on the same rows
+    path = str(tmp_path / "config.db")
+    run_ops(path, 7, steps=200)
+    store = ConfigStore(path)
+    config = store.load()
+    group = next(g for g in config.groups if len(g.apps) > 1)
+    group.apps.append(group.apps.pop(0))
+    store.mark(group)
+    store.sync(config)
+    assert store.row_writes == 1
+    store.close()
+    assert stored(path) == json.loads(json.dumps(config.to_dict()))
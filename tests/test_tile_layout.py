@@ -0,0 +1,76 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tile_layout import TILE_SPANS, fit_span, pack_tiles
+
+
+def grid_map_positions(wide_flags, max_cols):
+    # The dict-based scan GroupWidget.grid_positions used before pack_tiles (1x1 and 2x1 only)
+    grid_map = {}
+    row = col = 0
+    positions = []
+    for is_wide in wide_flags:
+        if max_cols < 2: is_wide = False
+        while True:
+            if is_wide:
+                if col + 1 < max_cols and not grid_map.get((row, col)) and not grid_map.get((row, col + 1)):
+                    break
+            elif not grid_map.get((row, col)):
+                break
+            col += 1
+            if col >= max_cols:
+                col = 0
+                row += 1
+        if is_wide:
+            positions.append((row, col, 2, 1))
+            grid_map[(row, col)] = grid_map[(row, col + 1)] = True
+        else:
+            positions.append((row, col, 1, 1))
+            grid_map[(row, col)] = True
+    while grid_map.get((row, col)):
+        col += 1
+        if col >= max_cols:
+            col = 0
+            row += 1
+    return positions, (row, col, 1, 1)
+
+
+def test_tiles_never_overlap_and_stay_inside_the_group():
+    rng = random.Random(17)
+    spans = list(TILE_SPANS.values())
+    for cols in (1, 2, 3, 4, 6, 8):
+        for _ in range(50):
+            tiles = [rng.choice(spans) for _ in range(rng.randint(0, 60))]
+            positions, add_cell = pack_tiles(tiles, cols)
+            taken = set()
+            for row, col, w, h in positions:
+                assert 0 <= col and col + w <= cols
+                cells = {(r, c) for r in range(row, row + h) for c in range(col, col + w)}
+                assert not cells & taken
+                taken |= cells
+            assert add_cell[:2] not in taken
+            assert 0 <= add_cell[1] < cols
+
+
+def test_spans_shrink_to_the_group_width():
+    assert fit_span((4, 2), 2) == (2, 2)
+    assert fit_span((4, 2), 3) == (3, 2)
+    assert fit_span((2, 2), 1) == (1, 1)
+    assert fit_span((2, 1), 1) == (1, 1)
+    assert fit_span((2, 2), 4) == (2, 2)
+    positions, _ = pack_tiles([(4, 2), (2, 2)], 2)
+    assert positions == [(0, 0, 2, 2), (2, 0, 2, 2)]
+    positions, _ = pack_tiles([(4, 2), (2, 1)], 1)
+    assert positions == [(0, 0, 1, 1), (1, 0, 1, 1)]
+
+
+def test_small_and_wide_tiles_match_the_old_grid_map_layout():
+    rng = random.Random(3)
+    for cols in (1, 2, 3, 4, 5, 8):
+        for _ in range(100):
+            wide = [rng.random() < 0.4 for _ in range(rng.randint(0, 40))]
+            spans = [(2, 1) if w else (1, 1) for w in wide]
+            assert pack_tiles(spans, cols) == grid_map_positions(wide, cols)
@@ -0,0 +1,49 @@
+# Tile layout engine for Lumex8: where tiles of given spans go in a group of a given width.
+# Plain Python with no Qt imports, so it can be used and tested without a display.
+
+# Tile sizes as (columns, rows), as in the Metro start screen
+TILE_SPANS = {"1x1": (1, 1), "2x1": (2, 1), "2x2": (2, 2), "4x2": (4, 2)}
+
+def fit_span(span, cols):
+    # Spans wider than the group shrink to its width, keeping them no taller than wide
+    w, h = span
+    if w > cols:
+        w = max(1, cols)
+        h = min(h, w)
+    return (w, h)
+
+def pack_tiles(spans, cols):
+    # Pure layout engine (no Qt). Places (w, h) spans left to right, top to bottom; the cursor
+    # never moves backwards, so tiles read in the order they are stored. Occupancy is one int
+    # bitmask per row, so finding a slot is a few bit operations per row instead of a cell scan.
+    # Returns ([(row, col, w, h), ...], (row, col, 1, 1)), the second item being the first
+    # free cell after the last tile.
+    cols = max(1, cols)
+    full = (1 << cols) - 1
+    rows = []
+    positions = []
+    row = col = 0
+    for w, h in spans:
+        if w > cols: w, h = fit_span((w, h), cols)
+        while True:
+            while len(rows) < row + h: rows.append(0)
+            used = rows[row]
+            if h > 1:
+                for r in range(row + 1, row + h): used |= rows[r]
+            # Bit c of starts is set when columns c .. c+w-1 are free in all h rows
+            free = starts = ~used & (full >> col << col)
+            for k in range(1, w): starts &= free >> k
+            if starts: break
+            row += 1
+            col = 0
+        col = (starts & -starts).bit_length() - 1
+        m = ((1 << w) - 1) << col
+        rows[row] |= m
+        for r in range(row + 1, row + h): rows[r] |= m
+        positions.append((row, col, w, h))
+    while row < len(rows) and rows[row] >> col & 1:
+        col += 1
+        if col >= cols:
+            row += 1
+            col = 0
+    return positions, (row, col, 1, 1)